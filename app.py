@@ -4,7 +4,8 @@ AICockpit Dashboard - Main Streamlit Application
 
 import streamlit as st
 from auth.login_requests import show_login_form, is_authenticated, show_logout_button, get_credentials
-from jira_api.client_requests import JiraClientRequests as JiraClient
+from jira_api.client_async import JiraClientAsync as JiraClient
+from components.overview import show_overview_dashboard
 from components.bugs import show_bugs_dashboard
 from components.incidents import show_incidents_dashboard
 from components.priorities import show_priorities_dashboard
@@ -12,6 +13,16 @@ from components.quarters import show_quarters_dashboard
 from components.gantt import show_gantt_dashboard
 from config.settings import PAGE_TITLE, PAGE_ICON, LAYOUT, PROJECT_KEY
 
+# Dashboards in navigation order
+DASHBOARDS = {
+    "📈 Overview": show_overview_dashboard,
+    "🐛 Bugs": show_bugs_dashboard,
+    "🚨 Incidents": show_incidents_dashboard,
+    "🎯 Priorities": show_priorities_dashboard,
+    "📅 Quarters": show_quarters_dashboard,
+    "📊 Gantt Chart": show_gantt_dashboard
+}
+
 
 def main():
     """Main application function"""
@@ -54,11 +65,12 @@ def main():
         background: #f8f9fa;
     }
     
-    .stTabs [data-baseweb="tab-list"] {
+    /* Dashboard navigation, styled like tabs */
+    div[role="radiogroup"] {
         gap: 2px;
     }
     
-    .stTabs [data-baseweb="tab"] {
+    div[role="radiogroup"] label[data-baseweb="radio"] {
         background: #f8f9fa;
         border-radius: 4px 4px 0px 0px;
         padding: 10px 20px;
@@ -67,12 +79,12 @@ def main():
         border: 1px solid #dee2e6;
     }
     
-    .stTabs [data-baseweb="tab"]:hover {
+    div[role="radiogroup"] label[data-baseweb="radio"]:hover {
         background: #e9ecef;
         color: #212529;
     }
     
-    .stTabs [aria-selected="true"] {
+    div[role="radiogroup"] label[data-baseweb="radio"]:has(input:checked) {
         background: #007bff;
         color: white !important;
         font-weight: 600;
@@ -89,9 +101,11 @@ def main():
     # Get credentials
     email, api_key = get_credentials()
     
-    # Initialize Jira client
+    # Initialize Jira client once per session; it shares a pooled connection per credential
     try:
-        jira_client = JiraClient(email, api_key)
+        if 'jira_client' not in st.session_state:
+            st.session_state.jira_client = JiraClient(email, api_key)
+        jira_client = st.session_state.jira_client
     except Exception as e:
         st.error(f"Failed to initialize Jira client: {str(e)}")
         return
@@ -117,8 +131,12 @@ def main():
 
         # Refresh button
         if st.button("🔄 Refresh Data", use_container_width=True):
-            st.cache_data.clear()
-            st.rerun()
+            try:
+                jira_client.refresh_project(project_key=st.session_state.project_key)
+                st.cache_data.clear()
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error refreshing data: {str(e)}")
         
         # Show logout button
         show_logout_button()
@@ -129,11 +147,20 @@ def main():
         try:
             # Pass the selected project key to the stats function
             stats = jira_client.get_project_statistics(project_key=st.session_state.project_key)
+            
+            # Data is served from cache and refreshed in the background, so show its age
+            status = jira_client.get_data_status(project_key=st.session_state.project_key)
+            if status['synced_at']:
+                data_time = status['synced_at'].astimezone().strftime('%H:%M')
+                refreshing = " (refreshing…)" if status['refreshing'] else ""
+                st.caption(f"🕒 Data as of {data_time}{refreshing}")
+            
             if stats:
                 st.subheader("📊 Quick Stats")
                 st.metric("Total Issues", stats.get('total_issues', 0))
                 st.metric("Open Issues", stats.get('open_issues', 0))
                 st.metric("Bugs", stats.get('bugs_count', 0))
+                st.metric("Story Points", f"{stats.get('story_points', 0):.0f}")
                 
                 # Top priority breakdown
                 priorities = stats.get('by_priority', {})
@@ -160,196 +187,17 @@ def main():
     """, unsafe_allow_html=True)
     
     
-    # Main dashboard tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "📈 Overview", 
-        "🐛 Bugs", 
-        "🚨 Incidents",
-        "🎯 Priorities", 
-        "📅 Quarters", 
-        "📊 Gantt Chart"
-    ])
-    
-    with tab1:
-        # Overview dashboard
-        st.header(f"📈 Project Overview: {st.session_state.project_key}")
-        
-        try:
-            # Get basic stats for the selected project
-            df = jira_client.get_board_issues(project_key=st.session_state.project_key)
-            if not df.empty:
-                # Key metrics
-                col1, col2, col3, col4, col5 = st.columns(5)
-                
-                with col1:
-                    total_issues = len(df)
-                    st.metric("Total Issues", total_issues)
-                
-                with col2:
-                    open_issues = len(df[df['status'] != 'Done'])
-                    st.metric("Open Issues", open_issues)
-                
-                with col3:
-                    closed_issues = len(df[df['status'] == 'Done'])
-                    st.metric("Closed Issues", closed_issues)
-                
-                with col4:
-                    bugs_count = len(df[df['is_bug'] == True])
-                    st.metric("Total Bugs", bugs_count)
-                
-                with col5:
-                    if total_issues > 0:
-                        completion_rate = (closed_issues / total_issues) * 100
-                        st.metric("Completion Rate", f"{completion_rate:.1f}%")
-                
-                st.markdown("---")
-                
-                # Overview charts
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Status distribution
-                    import plotly.express as px
-                    status_counts = df['status'].value_counts()
-                    
-                    fig_status = px.pie(
-                        values=status_counts.values,
-                        names=status_counts.index,
-                        title="Issues by Status"
-                    )
-                    st.plotly_chart(fig_status, use_container_width=True)
-                
-                with col2:
-                    # Area distribution
-                    area_counts = df['areas'].value_counts()
-                    
-                    fig_areas = px.bar(
-                        x=area_counts.values,
-                        y=area_counts.index,
-                        orientation='h',
-                        title="Issues by Area"
-                    )
-                    st.plotly_chart(fig_areas, use_container_width=True)
-                
-                # Issues by Area breakdown
-                st.subheader("📋 Issues by Area")
-                
-                # Show total issues fetched
-                st.write(f"**Total de issues carregadas:** {len(df)}")
-                st.markdown("---")
-                
-                all_labels = []
-                for labels_str in df['areas']:
-                    if labels_str != 'No Area':
-                        labels_list = labels_str.split(', ')
-                        all_labels.extend(labels_list)
-                
-                if all_labels:
-                    unique_labels = list(set(all_labels))
-                    
-                    # Create expandable sections for each area
-                    for label in sorted(unique_labels):
-                        count = all_labels.count(label)
-                        area_issues = df[df['areas'].str.contains(label, na=False)]
-                        
-                        with st.expander(f"📊 {label} ({count} issues)"):
-                            # Area metrics
-                            col1, col2, col3, col4 = st.columns(4)
-                            
-                            with col1:
-                                area_open = len(area_issues[area_issues['status'] != 'Done'])
-                                st.metric("Open", area_open)
-                            
-                            with col2:
-                                area_done = len(area_issues[area_issues['status'] == 'Done'])
-                                st.metric("Done", area_done)
-                            
-                            with col3:
-                                area_bugs = len(area_issues[area_issues['is_bug'] == True])
-                                st.metric("Bugs", area_bugs)
-                            
-                            with col4:
-                                if count > 0:
-                                    completion_rate = (area_done / count) * 100
-                                    st.metric("Completion", f"{completion_rate:.1f}%")
-                            
-                            # Area charts
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                # Status distribution for this area
-                                area_status = area_issues['status'].value_counts()
-                                if not area_status.empty:
-                                    fig_area_status = px.pie(
-                                        values=area_status.values,
-                                        names=area_status.index,
-                                        title=f"{label} - Status Distribution"
-                                    )
-                                    st.plotly_chart(fig_area_status, use_container_width=True)
-                            
-                            with col2:
-                                # Priority distribution for this area
-                                area_priority = area_issues['priority'].value_counts()
-                                if not area_priority.empty:
-                                    priority_colors = {
-                                        'Highest': '#8B0000',
-                                        'High': '#FF4500', 
-                                        'Medium': '#FFD700',
-                                        'Low': '#32CD32',
-                                        'Lowest': '#87CEEB'
-                                    }
-                                    fig_area_priority = px.pie(
-                                        values=area_priority.values,
-                                        names=area_priority.index,
-                                        title=f"{label} - Priority Distribution",
-                                        color_discrete_map=priority_colors
-                                    )
-                                    st.plotly_chart(fig_area_priority, use_container_width=True)
-                            
-                            # Area issues table
-                            st.subheader(f"Recent {label} Issues")
-                            area_recent = area_issues.sort_values('updated', ascending=False).head(5)
-                            display_columns = ['key', 'summary', 'status', 'priority', 'assignee', 'updated']
-                            st.dataframe(
-                                area_recent[display_columns],
-                                use_container_width=True
-                            )
-                else:
-                    st.write("❌ **Nenhuma área encontrada nos dados**")
-                
-                # Recent activity
-                st.subheader("Recent Activity")
-                recent_issues = df.sort_values('updated', ascending=False).head(10)
-                display_columns = ['key', 'summary', 'status', 'priority', 'assignee', 'areas', 'updated']
-                st.dataframe(
-                    recent_issues[display_columns],
-                    use_container_width=True
-                )
-            else:
-                st.warning("No data available")
-        except Exception as e:
-            st.error(f"Error loading overview: {str(e)}")
-    
-    with tab2:
-        # Bugs dashboard
-        show_bugs_dashboard(jira_client, project_key=st.session_state.project_key)
-    
-    with tab3:
-        # Incidents dashboard
-        show_incidents_dashboard(jira_client, project_key=st.session_state.project_key)
-    
-    with tab4:
-        # Priorities dashboard
-        show_priorities_dashboard(jira_client, project_key=st.session_state.project_key)
-    
-    with tab5:
-        # Quarters dashboard
-        show_quarters_dashboard(jira_client, project_key=st.session_state.project_key)
+    # Dashboard navigation - only the selected dashboard runs on each rerun, and the
+    # radio's key keeps the selection in session state across reruns
+    dashboard = st.radio(
+        "Dashboard",
+        options=list(DASHBOARDS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_dashboard"
+    )
     
-    with tab6:
-        # Gantt chart dashboard
-        show_gantt_dashboard(jira_client, project_key=st.session_state.project_key)
-
+    DASHBOARDS[dashboard](jira_client, project_key=st.session_state.project_key)
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,7 @@ import streamlit as st
 import requests
 import base64
 from config.settings import JIRA_SERVER
+from jira_api.transport import close_transport
 
 
 def show_login_form():
@@ -126,7 +127,15 @@ def is_authenticated():
 
 def logout():
     """Logout user and clear session"""
-    for key in ['authenticated', 'email', 'api_key', 'user_info']:
+    # Close the pooled Jira connections opened for these credentials; the async transport
+    # is shared with other sessions using them, so this session only releases its share
+    email, api_key = get_credentials()
+    if email and api_key:
+        close_transport(email, api_key)
+    if 'jira_client' in st.session_state:
+        st.session_state.jira_client.close()
+    
+    for key in ['authenticated', 'email', 'api_key', 'user_info', 'jira_client']:
         if key in st.session_state:
             del st.session_state[key]
     st.rerun()
@@ -0,0 +1,49 @@
+"""
+Figure cache so unchanged Plotly charts are not rebuilt with Plotly Express on every rerun
+"""
+
+import threading
+from collections import OrderedDict
+import streamlit as st
+from config.settings import FIGURE_CACHE_SIZE
+
+# Figures are keyed by chart id, data version and parameters, so sessions seeing the same data share them
+_figures = OrderedDict()
+_figures_lock = threading.Lock()
+
+
+def _freeze(value):
+    """Hashable form of a chart parameter"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def cached_figure(chart_id, data, params, build):
+    """Return the figure `build()` made from `data` for this chart and parameters, building it on a miss"""
+    # Keyed by the version the frame or cube was read at, never one read separately from it
+    data_version = data.attrs.get('data_version')
+    if data_version is None:
+        return build()
+
+    key = (chart_id, data_version, _freeze(params))
+    with _figures_lock:
+        figure = _figures.get(key)
+        if figure is not None:
+            _figures.move_to_end(key)
+            return figure
+
+    # Built outside the lock; two sessions racing on the same chart just build it twice
+    figure = build()
+    with _figures_lock:
+        _figures[key] = figure
+        while len(_figures) > FIGURE_CACHE_SIZE:
+            _figures.popitem(last=False)
+    return figure
+
+
+def plotly_chart(chart_id, data, params, build):
+    """Show the cached figure built from `data` full width; figures are shared, so nobody may mutate them later"""
+    st.plotly_chart(cached_figure(chart_id, data, params, build), use_container_width=True)
@@ -0,0 +1,126 @@
+"""
+Shared filter engine answering the dashboards' multiselect filters from per-value bitmap indexes
+"""
+
+from collections import OrderedDict
+import numpy as np
+import streamlit as st
+from config.settings import FILTER_CACHE_SIZE
+from jira_api.areas import area_membership
+
+# Filter name -> frame column it is answered from; 'area' is the per-area membership of an area mask
+ISSUE_FILTERS = {
+    'status': 'status',
+    'priority': 'priority',
+    'areas': 'areas',
+    'issue_type': 'issue_type',
+    'quarter': 'quarter_key',
+    'area': 'area_mask'
+}
+
+# The same filters over the rows built by get_gantt_data
+GANTT_FILTERS = {
+    'status': 'Status',
+    'priority': 'Priority',
+    'area': 'AreaMask'
+}
+
+
+class FilterIndex:
+    def __init__(self, frame, filters=ISSUE_FILTERS):
+        """Build a packed bitmap of the matching rows for every value of each filter present in the frame"""
+        self.size = len(frame)
+        self.bitmaps = {}
+        for name, column in filters.items():
+            if column not in frame.columns:
+                continue
+            if name == 'area':
+                membership = area_membership(frame[column])
+                self.bitmaps[name] = {
+                    area: np.packbits(rows.to_numpy()) for area, rows in membership.items() if rows.any()
+                }
+                continue
+
+            # Categories are sorted, so options come out in a stable order
+            values = frame[column].astype('category').cat.remove_unused_categories()
+            codes = values.cat.codes.to_numpy()
+            self.bitmaps[name] = {
+                value: np.packbits(codes == code) for code, value in enumerate(values.cat.categories)
+            }
+
+    def match(self, selections):
+        """Packed bitmap of the rows that take one of the selected values of every filter; None skips a filter"""
+        result = np.packbits(np.ones(self.size, dtype=bool))
+        for name, values in selections.items():
+            if values is None:
+                continue
+            bitmaps = self.bitmaps.get(name, {})
+            selected = np.zeros_like(result)
+            for value in values:
+                if value in bitmaps:
+                    selected |= bitmaps[value]
+            result &= selected
+        return result
+
+    def mask(self, packed):
+        """Boolean row mask of a packed bitmap"""
+        return np.unpackbits(packed, count=self.size).astype(bool)
+
+    def options(self, name, selections=None):
+        """Values of a filter that occur in the frame, or in the rows matching `selections`"""
+        bitmaps = self.bitmaps.get(name, {})
+        if not selections:
+            return list(bitmaps)
+        rows = self.match(selections)
+        return [value for value, bitmap in bitmaps.items() if (bitmap & rows).any()]
+
+
+@st.cache_resource(max_entries=16)
+def _filter_index(data_version, name, filters, _frame):
+    """Index a dashboard frame once per dataset version"""
+    return FilterIndex(_frame, dict(filters))
+
+
+class FilterEngine:
+    def __init__(self, frame, name, filters=ISSUE_FILTERS):
+        """Filter `frame`, the `name` dataset, through the shared bitmap index of the data version it was read at"""
+        self.frame = frame
+        # The version comes with the frame itself, so an index is never shared with another version's rows
+        data_version = frame.attrs.get('data_version')
+        self.cache_key = None if data_version is None else (data_version, name)
+        if self.cache_key is None:
+            # Read straight from Jira, so there is no version to share an index under
+            self.index = FilterIndex(frame, filters)
+            return
+
+        self.index = _filter_index(data_version, name, tuple(filters.items()), frame)
+        if self.index.size != len(frame):
+            # Not the frame the index was built for, e.g. a copy mutated by the caller
+            self.index = FilterIndex(frame, filters)
+
+    def options(self, name, **selections):
+        """Values of a filter present in the frame, optionally only among the rows matching `selections`"""
+        return self.index.options(name, selections)
+
+    def filter(self, **selections):
+        """Rows of the frame matching every selection; a filter set to None is not applied"""
+        if self.cache_key is None:
+            return self.frame[self.index.mask(self.index.match(selections))]
+
+        key = (self.cache_key, tuple(
+            (name, None if values is None else tuple(sorted(map(str, values))))
+            for name, values in sorted(selections.items())
+        ))
+
+        # Recent results are remembered per session, so toggling back to a selection is a lookup
+        results = st.session_state.setdefault('filter_results', OrderedDict())
+        packed = results.get(key)
+        if packed is None:
+            packed = self.index.match(selections)
+            results[key] = packed
+            while len(results) > FILTER_CACHE_SIZE:
+                results.popitem(last=False)
+        else:
+            results.move_to_end(key)
+
+        return self.frame[self.index.mask(packed)]
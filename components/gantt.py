@@ -6,9 +6,17 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import math
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from config.settings import COLORS, AREA_COLORS, AREAS, STATUS_COLORS
+from config.settings import (
+    COLORS, AREA_COLORS, STATUS_COLORS, GANTT_PAGE_SIZE, GANTT_SWIMLANE_THRESHOLD, GANTT_MAX_LANES,
+    GANTT_MAX_BUCKETS
+)
+from jira_api.areas import area_membership
+from components.filters import FilterEngine, GANTT_FILTERS
+from components.charts import plotly_chart
 
 
 def show_gantt_dashboard(jira_client, project_key):
@@ -21,81 +29,69 @@ def show_gantt_dashboard(jira_client, project_key):
         st.warning("No data available for this project.")
         return
     
-    # Sidebar filters
-    st.sidebar.header("Gantt Chart Filters")
-    
-    # Area filter - Get all unique areas from the data
-    all_areas_in_data = df['areas'].str.split(', ').explode().unique()
-    available_areas = []
-    
-    # Add configured areas that exist in data
-    for area in AREAS:
-        if area in all_areas_in_data:
-            available_areas.append(area)
+    # Filters and charts rerun on their own when a filter changes
+    _show_gantt_timeline(jira_client, project_key, df)
+
+
+@st.fragment
+def _show_gantt_timeline(jira_client, project_key, df):
+    """Gantt filters with the filtered timeline, per-area timelines and summary charts"""
+    # Filters live next to the chart rather than in the sidebar, so changing one reruns only this section
+    st.subheader("Gantt Chart Filters")
     
-    # Add any other areas found in data that aren't in our config
-    for area in all_areas_in_data:
-        if area not in AREAS and area != 'No Area' and area not in available_areas:
-            available_areas.append(area)
+    # Filters are answered from bitmap indexes of the issue frame and of the Gantt rows
+    engine = FilterEngine(df, 'board')
     
-    # Always add 'No Area' option
-    if 'No Area' in all_areas_in_data:
-        available_areas.append('No Area')
+    # Area filter - areas that occur in the data, in configured order with 'No Area' last
+    available_areas = engine.options('area')
     
+    col1, col2, col3, col4 = st.columns(4)
     
-    selected_areas = st.sidebar.multiselect(
-        "Filter by Area",
-        options=available_areas,
-        default=available_areas,
-        help="Select areas to display in the Gantt chart"
-    )
+    with col1:
+        selected_areas = st.multiselect(
+            "Filter by Area",
+            options=available_areas,
+            default=available_areas,
+            help="Select areas to display in the Gantt chart",
+            key="gantt_area_filter"
+        )
     
-    # Status filter
-    selected_statuses = st.sidebar.multiselect(
-        "Filter by Status",
-        options=df['status'].unique(),
-        default=df['status'].unique()
-    )
+    with col2:
+        selected_statuses = st.multiselect(
+            "Filter by Status",
+            options=engine.options('status'),
+            default=engine.options('status'),
+            key="gantt_status_filter"
+        )
     
-    # Priority filter
-    selected_priorities = st.sidebar.multiselect(
-        "Filter by Priority",
-        options=df['priority'].unique(),
-        default=df['priority'].unique()
-    )
+    with col3:
+        selected_priorities = st.multiselect(
+            "Filter by Priority",
+            options=engine.options('priority'),
+            default=engine.options('priority'),
+            key="gantt_priority_filter"
+        )
     
     # Date range filter
     min_date = df['created'].min().date()
     max_date = df['created'].max().date()
     
-    date_range = st.sidebar.date_input(
-        "Date Range",
-        value=(min_date, max_date),
-        min_value=min_date,
-        max_value=max_date
-    )
-    
-    # Apply filters
-    filtered_df = df.copy()
-    
-    # Filter by areas - Fixed for multi-area issues
-    if selected_areas:
-        def check_area_match(areas_string):
-            if areas_string == 'No Area':
-                return 'No Area' in selected_areas
-            else:
-                # Split the areas and check if any selected area is in the issue's areas
-                issue_areas = [area.strip() for area in areas_string.split(',')]
-                return any(selected_area in issue_areas for selected_area in selected_areas)
-        
-        area_mask = filtered_df['areas'].apply(check_area_match)
-        filtered_df = filtered_df[area_mask]
-    
-    # Filter by status
-    filtered_df = filtered_df[filtered_df['status'].isin(selected_statuses)]
+    with col4:
+        date_range = st.date_input(
+            "Date Range",
+            value=(min_date, max_date),
+            min_value=min_date,
+            max_value=max_date,
+            key="gantt_date_range"
+        )
     
-    # Filter by priority
-    filtered_df = filtered_df[filtered_df['priority'].isin(selected_priorities)]
+    # Apply filters - an issue matches an area filter if it is in any selected area, and
+    # selecting no area shows every area
+    filtered_df = engine.filter(
+        area=selected_areas or None,
+        status=selected_statuses,
+        priority=selected_priorities
+    )
     
     # Filter by date range
     if len(date_range) == 2:
@@ -130,18 +126,18 @@ def show_gantt_dashboard(jira_client, project_key):
     
     st.markdown("---")
     
-    # Prepare Gantt data
-    gantt_data = jira_client.get_gantt_data(project_key=project_key, selected_areas=selected_areas)
+    # Prepare Gantt data; the rows of every area are built once and filtered like the issues
+    gantt_data = jira_client.get_gantt_data(project_key=project_key)
     
     if gantt_data.empty:
         st.warning("No data available for Gantt chart with current filters.")
         return
     
-    # Apply additional filters to Gantt data
-    gantt_filtered = gantt_data[
-        (gantt_data['Status'].isin(selected_statuses)) &
-        (gantt_data['Priority'].isin(selected_priorities))
-    ]
+    gantt_filtered = FilterEngine(gantt_data, 'gantt', GANTT_FILTERS).filter(
+        area=selected_areas or None,
+        status=selected_statuses,
+        priority=selected_priorities
+    )
     
     if len(date_range) == 2:
         start_date, end_date = date_range
@@ -154,156 +150,155 @@ def show_gantt_dashboard(jira_client, project_key):
         st.warning("No tasks match the selected filters for Gantt chart.")
         return
     
+    # Charts are cached per filter selection and day, since the "Today" marker moves daily
+    current_date = datetime.now()
+    chart_params = (selected_areas, selected_statuses, selected_priorities, date_range, current_date.date())
+    
     # Create Gantt chart
     st.subheader("Project Timeline")
     
     # Sort by start date and resource
     gantt_filtered = gantt_filtered.sort_values(['Resource', 'Start'])
     
-    # Create color mapping for resources (areas)
-    resource_colors = {}
-    for resource in gantt_filtered['Resource'].unique():
-        if resource in AREA_COLORS:
-            resource_colors[resource] = AREA_COLORS[resource]
-        else:
-            resource_colors[resource] = COLORS['primary']
-    
-    # Create Gantt chart using Plotly
-    fig = px.timeline(
-        gantt_filtered,
-        x_start="Start",
-        x_end="Finish",
-        y="Task",
-        color="Resource",
-        title="Project Timeline by Area",
-        color_discrete_map=resource_colors,
-        hover_data=["Status", "Priority", "Assignee", "Summary"]
+    # Large timelines collapse into swimlanes by default; tasks are always drawn a page at a time
+    views = ["Tasks", "Swimlanes by area", "Swimlanes by assignee"]
+    view = st.radio(
+        "Timeline view",
+        options=views,
+        index=0 if len(gantt_filtered) <= GANTT_SWIMLANE_THRESHOLD else 1,
+        horizontal=True,
+        key="gantt_view"
     )
     
-    # Add current date line using add_shape - Enhanced visibility
-    current_date = datetime.now()
-    fig.add_shape(
-        type="line",
-        x0=current_date,
-        x1=current_date,
-        y0=0,
-        y1=1,
-        yref="paper",
-        line=dict(color="#FF0000", width=4, dash="solid")
-    )
-    
-    # Add annotation for "Today" - Enhanced visibility
-    fig.add_annotation(
-        x=current_date,
-        y=1.02,
-        yref="paper",
-        text="Today",
-        showarrow=True,
-        arrowhead=2,
-        arrowcolor="#FF0000",
-        arrowsize=1.5,
-        arrowwidth=2,
-        bgcolor="#FFFFFF",
-        bordercolor="#FF0000",
-        borderwidth=2,
-        font=dict(color="#FF0000", size=12, family="Arial Black")
-    )
-    
-    # Update layout
-    fig.update_layout(
-        height=max(400, len(gantt_filtered) * 25),
-        xaxis_title="Timeline",
-        yaxis_title="Issues",
-        showlegend=True
-    )
-    
-    # Update y-axis to show issue keys
-    fig.update_yaxes(categoryorder="total ascending")
-    
-    st.plotly_chart(fig, use_container_width=True)
+    if view == "Tasks":
+        page_rows, page = _task_page(gantt_filtered, "gantt_page")
+        
+        # Create color mapping for resources (areas)
+        resource_colors = {}
+        for resource in page_rows['Resource'].unique():
+            if resource in AREA_COLORS:
+                resource_colors[resource] = AREA_COLORS[resource]
+            else:
+                resource_colors[resource] = COLORS['primary']
+        
+        # Create Gantt chart using Plotly
+        def build_timeline_chart():
+            fig = px.timeline(
+                page_rows,
+                x_start="Start",
+                x_end="Finish",
+                y="Task",
+                color="Resource",
+                title="Project Timeline by Area",
+                color_discrete_map=resource_colors,
+                hover_data=["Status", "Priority", "Assignee", "Summary"]
+            )
+            
+            # Add current date line and "Today" annotation - Enhanced visibility
+            _add_today_marker(fig, current_date)
+            
+            # Update layout
+            fig.update_layout(
+                height=max(400, len(page_rows) * 25),
+                xaxis_title="Timeline",
+                yaxis_title="Issues",
+                showlegend=True
+            )
+            
+            # Update y-axis to show issue keys
+            fig.update_yaxes(categoryorder="total ascending")
+            
+            return fig
+        
+        plotly_chart('gantt.timeline', gantt_data, (chart_params, page), build_timeline_chart)
+    else:
+        lanes_by = 'area' if view == "Swimlanes by area" else 'assignee'
+        
+        # One row per lane and one column per time bucket, so the chart size does not grow with the task count
+        def build_swimlane_chart():
+            lanes = _swimlanes(gantt_filtered, lanes_by)
+            fig = px.imshow(
+                lanes,
+                aspect='auto',
+                color_continuous_scale='Blues',
+                labels=dict(x="Timeline", y="Area" if lanes_by == 'area' else "Assignee", color="Active tasks"),
+                title=f"Active Tasks per {'Area' if lanes_by == 'area' else 'Assignee'}"
+            )
+            _add_today_marker(fig, current_date)
+            fig.update_layout(height=max(300, len(lanes) * 30 + 150))
+            return fig
+        
+        plotly_chart('gantt.swimlanes', gantt_data, (chart_params, lanes_by), build_swimlane_chart)
     
     # Area-based timeline view
     st.subheader("Timeline by Area")
     
-    # Group by area and create separate timeline - Fixed for multi-area issues
+    # Metrics of every area come from one grouped count - multi-area issues count under each of their areas
+    membership = area_membership(gantt_filtered['AreaMask'])
+    area_statuses = membership.T.astype(int) @ pd.get_dummies(gantt_filtered['Status']).astype(int)
+    area_statuses = area_statuses.reindex(columns=['Done', 'In Progress'], fill_value=0)
+    area_sizes = membership.sum()
+    
+    # Streamlit builds expander content even while it is collapsed, so each area
+    # is a toggle and its timeline and table are only built once it is switched on
     for area in selected_areas:
-        # Check if any resource contains this area (for multi-area issues)
-        area_mask = gantt_filtered['Resource'].str.contains(area, na=False)
-        area_data = gantt_filtered[area_mask]
+        if area not in area_sizes.index or area_sizes[area] == 0:
+            continue
+        
+        if not st.toggle(f"📋 {area} ({area_sizes[area]} issues)", key=f"gantt_area_{area}"):
+            continue
+        
+        # Area metrics
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            area_completed = int(area_statuses.at[area, 'Done'])
+            st.metric("Completed", area_completed)
+        
+        with col2:
+            area_in_progress = int(area_statuses.at[area, 'In Progress'])
+            st.metric("In Progress", area_in_progress)
         
-        if not area_data.empty:
+        with col3:
+            area_completion = (area_completed / area_sizes[area]) * 100
+            st.metric("Completion %", f"{area_completion:.1f}%")
+        
+        area_data = gantt_filtered[membership[area]]
+        
+        # Area timeline, drawn a page at a time like the project timeline
+        area_rows, area_page = _task_page(area_data, f"gantt_page_{area}")
+        
+        def build_area_timeline_chart():
+            area_fig = px.timeline(
+                area_rows,
+                x_start="Start",
+                x_end="Finish",
+                y="Task",
+                color="Status",
+                title=f"{area} Timeline",
+                color_discrete_map=STATUS_COLORS,
+                hover_data=["Priority", "Assignee", "Summary"]
+            )
+            
+            # Add current date line and "Today" annotation to area timeline - Enhanced visibility
+            _add_today_marker(area_fig, current_date)
             
-            with st.expander(f"📋 {area} ({len(area_data)} issues)"):
-                # Area metrics
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    area_completed = len(area_data[area_data['Status'] == 'Done'])
-                    st.metric("Completed", area_completed)
-                
-                with col2:
-                    area_in_progress = len(area_data[area_data['Status'] == 'In Progress'])
-                    st.metric("In Progress", area_in_progress)
-                
-                with col3:
-                    if len(area_data) > 0:
-                        area_completion = (area_completed / len(area_data)) * 100
-                        st.metric("Completion %", f"{area_completion:.1f}%")
-                
-                # Area timeline
-                area_fig = px.timeline(
-                    area_data,
-                    x_start="Start",
-                    x_end="Finish",
-                    y="Task",
-                    color="Status",
-                    title=f"{area} Timeline",
-                    color_discrete_map=STATUS_COLORS,
-                    hover_data=["Priority", "Assignee", "Summary"]
-                )
-                
-                # Add current date line to area timeline using add_shape - Enhanced visibility
-                area_fig.add_shape(
-                    type="line",
-                    x0=current_date,
-                    x1=current_date,
-                    y0=0,
-                    y1=1,
-                    yref="paper",
-                    line=dict(color="#FF0000", width=4, dash="solid")
-                )
-                
-                # Add annotation for "Today" in area timeline - Enhanced visibility
-                area_fig.add_annotation(
-                    x=current_date,
-                    y=1.02,
-                    yref="paper",
-                    text="Today",
-                    showarrow=True,
-                    arrowhead=2,
-                    arrowcolor="#FF0000",
-                    arrowsize=1.5,
-                    arrowwidth=2,
-                    bgcolor="#FFFFFF",
-                    bordercolor="#FF0000",
-                    borderwidth=2,
-                    font=dict(color="#FF0000", size=12, family="Arial Black")
-                )
-                
-                area_fig.update_layout(
-                    height=max(300, len(area_data) * 20),
-                    showlegend=True
-                )
-                
-                st.plotly_chart(area_fig, use_container_width=True)
-                
-                # Area issues table
-                st.subheader(f"{area} Issues Details")
-                display_columns = ['Task', 'Summary', 'Status', 'Priority', 'Assignee', 'Start', 'Finish']
-                st.dataframe(
-                    area_data[display_columns].sort_values('Start'),
-                    use_container_width=True
-                )
+            area_fig.update_layout(
+                height=max(300, len(area_rows) * 20),
+                showlegend=True
+            )
+            
+            return area_fig
+        
+        plotly_chart('gantt.area_timeline', gantt_data, (area, chart_params, area_page), build_area_timeline_chart)
+        
+        # Area issues table
+        st.subheader(f"{area} Issues Details")
+        display_columns = ['Task', 'Summary', 'Status', 'Priority', 'Assignee', 'Start', 'Finish']
+        st.dataframe(
+            area_data[display_columns].sort_values('Start'),
+            use_container_width=True
+        )
     
     # Summary statistics
     st.subheader("Timeline Summary")
@@ -314,13 +309,16 @@ def show_gantt_dashboard(jira_client, project_key):
         # Issues by status in timeline
         status_counts = gantt_filtered['Status'].value_counts()
         
-        fig_status = px.pie(
-            values=status_counts.values,
-            names=status_counts.index,
-            title="Timeline Issues by Status",
-            color_discrete_map=STATUS_COLORS
-        )
-        st.plotly_chart(fig_status, use_container_width=True)
+        def build_status_chart():
+            fig_status = px.pie(
+                values=status_counts.values,
+                names=status_counts.index,
+                title="Timeline Issues by Status",
+                color_discrete_map=STATUS_COLORS
+            )
+            return fig_status
+        
+        plotly_chart('gantt.status', gantt_data, chart_params, build_status_chart)
     
     with col2:
         # Issues by priority in timeline
@@ -334,10 +332,96 @@ def show_gantt_dashboard(jira_client, project_key):
             'Lowest': '#87CEEB'
         }
         
-        fig_priority = px.pie(
-            values=priority_counts.values,
-            names=priority_counts.index,
-            title="Timeline Issues by Priority",
-            color_discrete_map=priority_colors
-        )
-        st.plotly_chart(fig_priority, use_container_width=True)
+        def build_priority_chart():
+            fig_priority = px.pie(
+                values=priority_counts.values,
+                names=priority_counts.index,
+                title="Timeline Issues by Priority",
+                color_discrete_map=priority_colors
+            )
+            return fig_priority
+        
+        plotly_chart('gantt.priority', gantt_data, chart_params, build_priority_chart)
+
+
+def _add_today_marker(fig, current_date):
+    """Draw the red "Today" line and label on a timeline figure"""
+    fig.add_shape(
+        type="line",
+        x0=current_date,
+        x1=current_date,
+        y0=0,
+        y1=1,
+        yref="paper",
+        line=dict(color="#FF0000", width=4, dash="solid")
+    )
+    fig.add_annotation(
+        x=current_date,
+        y=1.02,
+        yref="paper",
+        text="Today",
+        showarrow=True,
+        arrowhead=2,
+        arrowcolor="#FF0000",
+        arrowsize=1.5,
+        arrowwidth=2,
+        bgcolor="#FFFFFF",
+        bordercolor="#FF0000",
+        borderwidth=2,
+        font=dict(color="#FF0000", size=12, family="Arial Black")
+    )
+
+
+def _task_page(rows, key):
+    """Rows of the page picked with a page selector, and the page number; small timelines are one page"""
+    if len(rows) <= GANTT_PAGE_SIZE:
+        return rows, 1
+    
+    pages = math.ceil(len(rows) / GANTT_PAGE_SIZE)
+    # The page lives only in session state, since a widget given a default as well warns; filters
+    # can shrink the timeline below the remembered page
+    if key not in st.session_state:
+        st.session_state[key] = 1
+    elif st.session_state[key] > pages:
+        st.session_state[key] = pages
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=key)
+    
+    start = (page - 1) * GANTT_PAGE_SIZE
+    page_rows = rows.iloc[start:start + GANTT_PAGE_SIZE]
+    st.caption(f"Showing tasks {start + 1}-{start + len(page_rows)} of {len(rows)}")
+    return page_rows, page
+
+
+def _swimlanes(rows, lanes_by):
+    """Tasks active in each lane per time bucket, as a lanes x bucket start dates frame"""
+    if lanes_by == 'area':
+        # Multi-area tasks count in each of their areas
+        membership = area_membership(rows['AreaMask']).rename(columns={'No Area': 'General'})
+    else:
+        # The busiest assignees get their own lane and everyone else shares one
+        counts = rows['Assignee'].value_counts()
+        top = counts.index[:GANTT_MAX_LANES - 1] if len(counts) > GANTT_MAX_LANES else counts.index
+        assignees = rows['Assignee'].where(rows['Assignee'].isin(top), 'Other')
+        membership = pd.get_dummies(assignees).astype(bool)
+        membership = membership[[lane for lane in [*top, 'Other'] if lane in membership.columns]]
+    membership = membership.loc[:, membership.any()]
+    
+    # Buckets are whole weeks or longer, and there are never more than GANTT_MAX_BUCKETS of them
+    origin = rows['Start'].min().normalize()
+    span_days = (max(rows['Start'].max(), rows['Finish'].max()) - origin).days + 1
+    bucket_days = max(7, math.ceil(span_days / GANTT_MAX_BUCKETS))
+    buckets = math.ceil(span_days / bucket_days)
+    
+    first = ((rows['Start'] - origin).dt.days // bucket_days).to_numpy()
+    last = np.maximum(((rows['Finish'] - origin).dt.days // bucket_days).to_numpy(), first)
+    
+    # A task adds one from its first bucket and removes it after its last, so a running sum counts active tasks
+    active = {}
+    for lane, in_lane in membership.items():
+        in_lane = in_lane.to_numpy()
+        changes = (np.bincount(first[in_lane], minlength=buckets + 1)
+                   - np.bincount(last[in_lane] + 1, minlength=buckets + 1))
+        active[lane] = np.cumsum(changes)[:buckets]
+    
+    columns = pd.date_range(origin, periods=buckets, freq=f'{bucket_days}D')
+    return pd.DataFrame.from_dict(active, orient='index', columns=columns)
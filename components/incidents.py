@@ -9,6 +9,8 @@ from plotly.subplots import make_subplots
 import pandas as pd
 from datetime import datetime, timedelta
 from config.settings import COLORS, STATUS_COLORS
+from components.filters import FilterEngine
+from components.charts import plotly_chart
 
 
 def show_incidents_dashboard(jira_client, project_key):
@@ -27,19 +29,22 @@ def show_incidents_dashboard(jira_client, project_key):
         st.info("No incidents found in the current dataset.")
         return
     
+    # Counts come from the project's aggregate cube, sliced like the JQL behind get_incidents
+    incident_cube = jira_client.get_issue_cube(project_key=project_key).select(issue_type=['Incident', 'Incidente'])
+    
     # Metrics row
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_incidents = len(incidents_df)
+        total_incidents = incident_cube.count()
         st.metric("Total Incidents", total_incidents)
     
     with col2:
-        open_incidents = len(incidents_df[incidents_df['status'] != 'Done'])
+        open_incidents = incident_cube.exclude(status='Done').count()
         st.metric("Open Incidents", open_incidents)
     
     with col3:
-        closed_incidents = len(incidents_df[incidents_df['status'] == 'Done'])
+        closed_incidents = incident_cube.select(status='Done').count()
         st.metric("Closed Incidents", closed_incidents)
     
     with col4:
@@ -59,25 +64,28 @@ def show_incidents_dashboard(jira_client, project_key):
     with col1:
         # Incident status distribution
         st.subheader("Incident Status Distribution")
-        status_counts = incidents_df['status'].value_counts()
+        status_counts = incident_cube.counts('status')
         
         colors = [STATUS_COLORS.get(status, COLORS['primary']) for status in status_counts.index]
         
-        fig_status = px.pie(
-            values=status_counts.values,
-            names=status_counts.index,
-            title="Incidents by Status",
-            color_discrete_sequence=colors
-        )
-        fig_status.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_status, use_container_width=True)
+        def build_status_chart():
+            fig_status = px.pie(
+                values=status_counts.values,
+                names=status_counts.index,
+                title="Incidents by Status",
+                color_discrete_sequence=colors
+            )
+            fig_status.update_traces(textposition='inside', textinfo='percent+label')
+            return fig_status
+        
+        plotly_chart('incidents.status', incident_cube, (), build_status_chart)
     
     with col2:
         # Incident priority distribution with clickable legend filter
         st.subheader("Incident Priority Distribution")
         
         # Create a stacked bar chart by status and priority with clickable legend
-        priority_status_df = incidents_df.groupby(['priority', 'status']).size().reset_index(name='count')
+        priority_status_df = incident_cube.counts('priority', 'status').reset_index()
         
         priority_colors = {
             'Highest': '#d62728',
@@ -87,77 +95,87 @@ def show_incidents_dashboard(jira_client, project_key):
             'Lowest': '#9467bd'
         }
         
-        fig_priority = px.bar(
-            priority_status_df,
-            x='priority',
-            y='count',
-            color='status',
-            title="Incidents by Priority (Click legend to filter)",
-            color_discrete_map=STATUS_COLORS,
-            hover_data=['priority', 'status', 'count']
-        )
-        
-        # Enable clickable legend
-        fig_priority.update_layout(
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=1,
-                xanchor="left",
-                x=1.02,
-                font=dict(size=10)
-            ),
-            margin=dict(r=150)
-        )
+        def build_priority_chart():
+            fig_priority = px.bar(
+                priority_status_df,
+                x='priority',
+                y='count',
+                color='status',
+                title="Incidents by Priority (Click legend to filter)",
+                color_discrete_map=STATUS_COLORS,
+                hover_data=['priority', 'status', 'count']
+            )
+            
+            # Enable clickable legend
+            fig_priority.update_layout(
+                showlegend=True,
+                legend=dict(
+                    orientation="v",
+                    yanchor="top",
+                    y=1,
+                    xanchor="left",
+                    x=1.02,
+                    font=dict(size=10)
+                ),
+                margin=dict(r=150)
+            )
+            
+            return fig_priority
         
-        st.plotly_chart(fig_priority, use_container_width=True)
+        plotly_chart('incidents.priority_status', incident_cube, (), build_priority_chart)
     
-    # Detailed incidents table
+    # Detailed incidents table - reruns on its own when a filter changes
+    _show_incident_details(incidents_df)
+
+
+@st.fragment
+def _show_incident_details(incidents_df):
+    """Incident filters with the matching incidents"""
     st.subheader("Incident Details")
     
     # Filter options
+    engine = FilterEngine(incidents_df, 'incidents')
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         status_filter = st.multiselect(
             "Filter by Status",
-            options=incidents_df['status'].unique(),
-            default=incidents_df['status'].unique(),
+            options=engine.options('status'),
+            default=engine.options('status'),
             key="incidents_status_filter"
         )
     
     with col2:
         priority_filter = st.multiselect(
             "Filter by Priority", 
-            options=incidents_df['priority'].unique(),
-            default=incidents_df['priority'].unique(),
+            options=engine.options('priority'),
+            default=engine.options('priority'),
             key="incidents_priority_filter"
         )
         
     with col3:
         area_filter = st.multiselect(
             "Filter by Area",
-            options=incidents_df['areas'].unique(),
-            default=incidents_df['areas'].unique(),
+            options=engine.options('areas'),
+            default=engine.options('areas'),
             key="incidents_area_filter"
         )
     
     with col4:
         type_filter = st.multiselect(
             "Filter by Type",
-            options=incidents_df['issue_type'].unique(),
-            default=incidents_df['issue_type'].unique(),
+            options=engine.options('issue_type'),
+            default=engine.options('issue_type'),
             key="incidents_type_filter"
         )
     
     # Apply filters
-    filtered_incidents = incidents_df[
-        (incidents_df['status'].isin(status_filter)) &
-        (incidents_df['priority'].isin(priority_filter)) &
-        (incidents_df['areas'].isin(area_filter)) &
-        (incidents_df['issue_type'].isin(type_filter))
-    ]
+    filtered_incidents = engine.filter(
+        status=status_filter,
+        priority=priority_filter,
+        areas=area_filter,
+        issue_type=type_filter
+    )
     
     # Display filtered results count
     st.write(f"Showing {len(filtered_incidents)} incidents")
@@ -0,0 +1,190 @@
+"""
+Project overview component for the dashboard
+"""
+
+import streamlit as st
+import plotly.express as px
+from config.settings import AREAS
+from components.charts import plotly_chart
+from jira_api.areas import area_filter
+
+
+def show_overview_dashboard(jira_client, project_key):
+    """Display the project overview with per-area breakdowns for a specific project"""
+    st.header(f"📈 Project Overview: {project_key}")
+    
+    try:
+        # Get basic stats for the selected project
+        df = jira_client.get_board_issues(project_key=project_key)
+        # Counts come from the aggregate cube; the frame is only needed for issue tables
+        cube = jira_client.get_issue_cube(project_key=project_key)
+        if not df.empty:
+            # Key metrics
+            col1, col2, col3, col4, col5 = st.columns(5)
+            
+            with col1:
+                total_issues = cube.count()
+                st.metric("Total Issues", total_issues)
+            
+            with col2:
+                open_issues = cube.exclude(status='Done').count()
+                st.metric("Open Issues", open_issues)
+            
+            with col3:
+                closed_issues = cube.select(status='Done').count()
+                st.metric("Closed Issues", closed_issues)
+            
+            with col4:
+                bugs_count = cube.select(is_bug=True).count()
+                st.metric("Total Bugs", bugs_count)
+            
+            with col5:
+                if total_issues > 0:
+                    completion_rate = (closed_issues / total_issues) * 100
+                    st.metric("Completion Rate", f"{completion_rate:.1f}%")
+            
+            st.markdown("---")
+            
+            # Overview charts
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Status distribution
+                status_counts = cube.counts('status')
+                
+                def build_status_chart():
+                    fig_status = px.pie(
+                        values=status_counts.values,
+                        names=status_counts.index,
+                        title="Issues by Status"
+                    )
+                    return fig_status
+                
+                plotly_chart('overview.status', cube, (), build_status_chart)
+            
+            with col2:
+                # Area distribution
+                area_counts = cube.counts('areas')
+                
+                def build_areas_chart():
+                    fig_areas = px.bar(
+                        x=area_counts.values,
+                        y=area_counts.index,
+                        orientation='h',
+                        title="Issues by Area"
+                    )
+                    return fig_areas
+                
+                plotly_chart('overview.areas', cube, (), build_areas_chart)
+            
+            # Issues by Area breakdown
+            st.subheader("📋 Issues by Area")
+            
+            # Show total issues fetched
+            st.write(f"**Total de issues carregadas:** {len(df)}")
+            st.markdown("---")
+            
+            _show_area_sections(df, cube)
+            
+            # Recent activity
+            st.subheader("Recent Activity")
+            recent_issues = df.sort_values('updated', ascending=False).head(10)
+            display_columns = ['key', 'summary', 'status', 'priority', 'assignee', 'areas', 'updated']
+            st.dataframe(
+                recent_issues[display_columns],
+                use_container_width=True
+            )
+        else:
+            st.warning("No data available")
+    except Exception as e:
+        st.error(f"Error loading overview: {str(e)}")
+
+
+@st.fragment
+def _show_area_sections(df, cube):
+    """Show a section per area with its metrics, building charts and tables only for the areas switched on"""
+    # Metrics of every area come from one pass over the cube per measure
+    area_totals = cube.area_counts()
+    area_done = cube.select(status='Done').area_counts()
+    area_bugs = cube.select(is_bug=True).area_counts()
+    unique_labels = [area for area in AREAS if area_totals[area] > 0]
+    
+    if not unique_labels:
+        st.write("❌ **Nenhuma área encontrada nos dados**")
+        return
+    
+    # Streamlit builds expander content even while it is collapsed, so each area
+    # is a toggle and its charts and table are only built once it is switched on
+    for label in sorted(unique_labels):
+        count = int(area_totals[label])
+        
+        if not st.toggle(f"📊 {label} ({count} issues)", key=f"overview_area_{label}"):
+            continue
+        
+        # Area metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            area_open = count - int(area_done[label])
+            st.metric("Open", area_open)
+        
+        with col2:
+            st.metric("Done", int(area_done[label]))
+        
+        with col3:
+            st.metric("Bugs", int(area_bugs[label]))
+        
+        with col4:
+            if count > 0:
+                completion_rate = (area_done[label] / count) * 100
+                st.metric("Completion", f"{completion_rate:.1f}%")
+        
+        # Area charts
+        area_cube = cube.select(area=label)
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Status distribution for this area
+            area_status = area_cube.counts('status')
+            if not area_status.empty:
+                def build_area_status_chart():
+                    fig_area_status = px.pie(
+                        values=area_status.values,
+                        names=area_status.index,
+                        title=f"{label} - Status Distribution"
+                    )
+                    return fig_area_status
+                
+                plotly_chart('overview.area_status', cube, (label,), build_area_status_chart)
+        
+        with col2:
+            # Priority distribution for this area
+            area_priority = area_cube.counts('priority')
+            if not area_priority.empty:
+                priority_colors = {
+                    'Highest': '#8B0000',
+                    'High': '#FF4500', 
+                    'Medium': '#FFD700',
+                    'Low': '#32CD32',
+                    'Lowest': '#87CEEB'
+                }
+                def build_area_priority_chart():
+                    fig_area_priority = px.pie(
+                        values=area_priority.values,
+                        names=area_priority.index,
+                        title=f"{label} - Priority Distribution",
+                        color_discrete_map=priority_colors
+                    )
+                    return fig_area_priority
+                
+                plotly_chart('overview.area_priority', cube, (label,), build_area_priority_chart)
+        
+        # Area issues table
+        st.subheader(f"Recent {label} Issues")
+        area_issues = df[area_filter(df['area_mask'], [label])]
+        area_recent = area_issues.sort_values('updated', ascending=False).head(5)
+        display_columns = ['key', 'summary', 'status', 'priority', 'assignee', 'updated']
+        st.dataframe(
+            area_recent[display_columns],
+            use_container_width=True
+        )
@@ -5,8 +5,11 @@ Priority visualization component for the dashboard
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 from config.settings import COLORS, PRIORITY_MAPPING
+from components.filters import FilterEngine
+from components.charts import plotly_chart
 
 
 def show_priorities_dashboard(jira_client, project_key):
@@ -19,23 +22,31 @@ def show_priorities_dashboard(jira_client, project_key):
         st.warning("No data available for this project.")
         return
     
+    # Counts come from the aggregate cube; the frame is only needed for issue tables and trends
+    cube = jira_client.get_issue_cube(project_key=project_key)
+    priority_counts = cube.counts('priority')
+    
     # Priority metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        highest_priority = len(df[df['priority'] == 'Highest'])
+        highest_priority = cube.select(priority='Highest').count()
         st.metric("Highest Priority", highest_priority, delta=None)
     
     with col2:
-        high_priority = len(df[df['priority'] == 'High'])
+        high_priority = cube.select(priority='High').count()
         st.metric("High Priority", high_priority, delta=None)
     
     with col3:
-        critical_open = len(df[(df['priority'].isin(['Highest', 'High'])) & (df['status'] != 'Done')])
+        critical_open = cube.select(priority=['Highest', 'High']).exclude(status='Done').count()
         st.metric("Critical Open Issues", critical_open, delta=None)
     
     with col4:
-        avg_priority = df['priority'].map(PRIORITY_MAPPING).mean()
+        # Mean score of the issues whose priority has one, weighted by issue count
+        scores = priority_counts.index.astype(str).map(PRIORITY_MAPPING).to_numpy(dtype=float)
+        weights = priority_counts.to_numpy()
+        scored = ~np.isnan(scores)
+        avg_priority = (scores[scored] * weights[scored]).sum() / weights[scored].sum()
         st.metric("Average Priority Score", f"{avg_priority:.1f}", delta=None)
     
     st.markdown("---")
@@ -46,7 +57,6 @@ def show_priorities_dashboard(jira_client, project_key):
     with col1:
         # Overall priority distribution
         st.subheader("Priority Distribution")
-        priority_counts = df['priority'].value_counts()
         
         priority_colors = {
             'Highest': '#8B0000',
@@ -56,36 +66,42 @@ def show_priorities_dashboard(jira_client, project_key):
             'Lowest': '#87CEEB'
         }
         
-        fig_priority = px.pie(
-            values=priority_counts.values,
-            names=priority_counts.index,
-            title="All Issues by Priority",
-            color=priority_counts.index,
-            color_discrete_map=priority_colors
-        )
-        fig_priority.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_priority, use_container_width=True)
+        def build_priority_chart():
+            fig_priority = px.pie(
+                values=priority_counts.values,
+                names=priority_counts.index,
+                title="All Issues by Priority",
+                color=priority_counts.index,
+                color_discrete_map=priority_colors
+            )
+            fig_priority.update_traces(textposition='inside', textinfo='percent+label')
+            return fig_priority
+        
+        plotly_chart('priorities.priority', cube, (), build_priority_chart)
     
     with col2:
         # Priority by status
         st.subheader("Priority vs Status")
-        priority_status = df.groupby(['priority', 'status']).size().reset_index(name='count')
+        priority_status = cube.counts('priority', 'status').reset_index()
         
-        fig_priority_status = px.bar(
-            priority_status,
-            x='priority',
-            y='count',
-            color='status',
-            title="Priority Distribution by Status",
-            category_orders={'priority': ['Highest', 'High', 'Medium', 'Low', 'Lowest']}
-        )
-        st.plotly_chart(fig_priority_status, use_container_width=True)
+        def build_priority_status_chart():
+            fig_priority_status = px.bar(
+                priority_status,
+                x='priority',
+                y='count',
+                color='status',
+                title="Priority Distribution by Status",
+                category_orders={'priority': ['Highest', 'High', 'Medium', 'Low', 'Lowest']}
+            )
+            return fig_priority_status
+        
+        plotly_chart('priorities.priority_status', cube, (), build_priority_status_chart)
     
     # Priority by area analysis
     st.subheader("Priority Analysis by Area")
     
     # Create priority heatmap by area
-    priority_area = df.groupby(['areas', 'priority']).size().unstack(fill_value=0)
+    priority_area = cube.counts('areas', 'priority').unstack(fill_value=0)
     
     if not priority_area.empty:
         # Reorder columns by priority importance
@@ -93,19 +109,22 @@ def show_priorities_dashboard(jira_client, project_key):
         existing_priorities = [p for p in priority_order if p in priority_area.columns]
         priority_area = priority_area[existing_priorities]
         
-        fig_heatmap = px.imshow(
-            priority_area.values,
-            x=priority_area.columns,
-            y=priority_area.index,
-            color_continuous_scale='Reds',
-            title="Priority Heatmap by Area",
-            text_auto=True
-        )
-        fig_heatmap.update_layout(
-            xaxis_title="Priority",
-            yaxis_title="Area"
-        )
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        def build_heatmap_chart():
+            fig_heatmap = px.imshow(
+                priority_area.values,
+                x=priority_area.columns,
+                y=priority_area.index,
+                color_continuous_scale='Reds',
+                title="Priority Heatmap by Area",
+                text_auto=True
+            )
+            fig_heatmap.update_layout(
+                xaxis_title="Priority",
+                yaxis_title="Area"
+            )
+            return fig_heatmap
+        
+        plotly_chart('priorities.area_heatmap', cube, (), build_heatmap_chart)
     
     # Critical issues alert
     st.subheader("🚨 Critical Issues Alert")
@@ -135,83 +154,96 @@ def show_priorities_dashboard(jira_client, project_key):
     
     # Group by month and priority
     df['created_month'] = df['created'].dt.to_period('M').astype(str)
-    priority_trends = df.groupby(['created_month', 'priority']).size().reset_index(name='count')
+    priority_trends = df.groupby(['created_month', 'priority'], observed=True).size().reset_index(name='count')
     
     if not priority_trends.empty:
-        fig_trends = px.line(
-            priority_trends,
-            x='created_month',
-            y='count',
-            color='priority',
-            title="Priority Trends Over Time",
-            color_discrete_map=priority_colors
-        )
-        fig_trends.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig_trends, use_container_width=True)
+        def build_trends_chart():
+            fig_trends = px.line(
+                priority_trends,
+                x='created_month',
+                y='count',
+                color='priority',
+                title="Priority Trends Over Time",
+                color_discrete_map=priority_colors
+            )
+            fig_trends.update_layout(xaxis_tickangle=-45)
+            return fig_trends
+        
+        plotly_chart('priorities.trends', df, (), build_trends_chart)
     
     # Priority by assignee
     st.subheader("Priority Distribution by Assignee")
     
-    assignee_priority = df.groupby(['assignee', 'priority']).size().reset_index(name='count')
+    assignee_priority = df.groupby(['assignee', 'priority'], observed=True).size().reset_index(name='count')
     top_assignees = df['assignee'].value_counts().head(10).index
     assignee_priority_filtered = assignee_priority[assignee_priority['assignee'].isin(top_assignees)]
     
     if not assignee_priority_filtered.empty:
-        fig_assignee_priority = px.bar(
-            assignee_priority_filtered,
-            x='assignee',
-            y='count',
-            color='priority',
-            title="Priority Distribution by Top Assignees",
-            color_discrete_map=priority_colors
-        )
-        fig_assignee_priority.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig_assignee_priority, use_container_width=True)
+        def build_assignee_priority_chart():
+            fig_assignee_priority = px.bar(
+                assignee_priority_filtered,
+                x='assignee',
+                y='count',
+                color='priority',
+                title="Priority Distribution by Top Assignees",
+                color_discrete_map=priority_colors
+            )
+            fig_assignee_priority.update_layout(xaxis_tickangle=-45)
+            return fig_assignee_priority
+        
+        plotly_chart('priorities.assignee_priority', df, (), build_assignee_priority_chart)
     
-    # Filters section
+    # Filters section - reruns on its own when a filter changes
+    _show_filtered_issues(df)
+
+
+@st.fragment
+def _show_filtered_issues(df):
+    """Issue filters with the matching issues"""
     st.subheader("🔍 Filter Issues by Type")
     
+    engine = FilterEngine(df, 'board')
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         status_filter = st.multiselect(
             "Filter by Status",
-            options=df['status'].unique(),
-            default=df['status'].unique(),
+            options=engine.options('status'),
+            default=engine.options('status'),
             key="priority_status_filter"
         )
     
     with col2:
         priority_filter = st.multiselect(
             "Filter by Priority",
-            options=df['priority'].unique(),
-            default=df['priority'].unique(),
+            options=engine.options('priority'),
+            default=engine.options('priority'),
             key="priority_priority_filter"
         )
     
     with col3:
         area_filter = st.multiselect(
             "Filter by Area",
-            options=df['areas'].unique(),
-            default=df['areas'].unique(),
+            options=engine.options('areas'),
+            default=engine.options('areas'),
             key="priority_area_filter"
         )
     
     with col4:
         type_filter = st.multiselect(
             "Filter by Type",
-            options=df['issue_type'].unique(),
-            default=df['issue_type'].unique(),
+            options=engine.options('issue_type'),
+            default=engine.options('issue_type'),
             key="priority_type_filter"
         )
     
     # Apply filters
-    filtered_df = df[
-        (df['status'].isin(status_filter)) &
-        (df['priority'].isin(priority_filter)) &
-        (df['areas'].isin(area_filter)) &
-        (df['issue_type'].isin(type_filter))
-    ]
+    filtered_df = engine.filter(
+        status=status_filter,
+        priority=priority_filter,
+        areas=area_filter,
+        issue_type=type_filter
+    )
     
     # Show filtered results
     st.subheader("Filtered Issues")
@@ -8,7 +8,10 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 from datetime import datetime, timedelta
+from jira_api.fields import quarter_label
 from config.settings import COLORS, AREA_COLORS
+from components.filters import FilterEngine
+from components.charts import plotly_chart
 
 
 def show_quarters_dashboard(jira_client, project_key):
@@ -40,63 +43,32 @@ def show_quarters_dashboard(jira_client, project_key):
     
     st.markdown("---")
     
-    # Quarter metrics with proper sorting
-    def sort_quarters(quarter_series):
-        # Convert quarters to sortable format
-        quarter_list = []
-        for quarter in quarter_series.index:
-            if isinstance(quarter, str) and 'Q' in quarter:
-                parts = quarter.split(' ')
-                if len(parts) == 2:
-                    q_num = int(parts[0][1:])  # Extract number from Q1, Q2, etc.
-                    year = int(parts[1])
-                    quarter_list.append((year, q_num, quarter))
-        
-        # Sort by year then quarter
-        quarter_list.sort(key=lambda x: (x[0], x[1]))
-        
-        # Return sorted series
-        sorted_quarters = [q[2] for q in quarter_list]
-        return quarter_series.reindex(sorted_quarters)
+    # Counts come from the aggregate cube; the frame is only needed for date checks and issue tables
+    cube = jira_client.get_issue_cube(project_key=project_key)
     
-    quarter_stats = sort_quarters(df['quarter'].value_counts())
+    # Quarter metrics - counted per integer quarter key, so sorting the index puts them in time order
+    quarter_stats = cube.counts('quarter_key').sort_index()
     
     col1, col2, col3, col4 = st.columns(4)
     
-    quarters = quarter_stats.index.tolist()
+    quarter_keys = quarter_stats.index.tolist()
+    quarters = [quarter_label(key) for key in quarter_keys]
     
-    # Calculate actual current quarter based on today's date
+    # Current and previous quarter from today's date, as quarter keys
     today = datetime.now()
-    current_quarter = f"Q{((today.month-1)//3)+1} {today.year}"
+    current_key = today.year * 4 + (today.month - 1) // 3
+    current_quarter = quarter_label(current_key)
+    prev_quarter_metric = quarter_label(current_key - 1)
     
     if len(quarters) >= 1:
         with col1:
-            # Show actual current quarter, not the last in the list
-            if current_quarter in quarters:
-                current_count = len(df[df['quarter'] == current_quarter])
-                st.metric("Current Quarter", current_quarter, current_count)
-            else:
-                # If current quarter has no issues, show it with 0
-                st.metric("Current Quarter", current_quarter, 0)
-    
-    # Calculate previous quarter based on current quarter for metrics
-    current_month = today.month
-    current_year = today.year
-    
-    if current_month <= 3:  # Q1
-        prev_quarter_metric = f"Q4 {current_year - 1}"
-    elif current_month <= 6:  # Q2
-        prev_quarter_metric = f"Q1 {current_year}"
-    elif current_month <= 9:  # Q3
-        prev_quarter_metric = f"Q2 {current_year}"
-    else:  # Q4
-        prev_quarter_metric = f"Q3 {current_year}"
+            # Show actual current quarter, not the last in the list (0 if it has no issues)
+            current_count = cube.select(quarter_key=current_key).count()
+            st.metric("Current Quarter", current_quarter, current_count)
     
     with col2:
         # Show actual previous quarter based on current date
-        prev_count = len(df[df['quarter'] == prev_quarter_metric])
-        current_count = len(df[df['quarter'] == current_quarter])
-        delta = current_count - prev_count
+        prev_count = cube.select(quarter_key=current_key - 1).count()
         st.metric("Previous Quarter", prev_quarter_metric, prev_count)
     
     with col3:
@@ -104,7 +76,7 @@ def show_quarters_dashboard(jira_client, project_key):
         st.metric("Total Quarters", total_quarters)
     
     with col4:
-        avg_per_quarter = df.groupby('quarter').size().mean()
+        avg_per_quarter = quarter_stats.mean()
         st.metric("Avg Issues/Quarter", f"{avg_per_quarter:.1f}")
     
     st.markdown("---")
@@ -116,95 +88,139 @@ def show_quarters_dashboard(jira_client, project_key):
         # Issues by quarter
         st.subheader("Issues by Quarter")
         
-        fig_quarters = px.bar(
-            x=quarter_stats.index,
-            y=quarter_stats.values,
-            title="Issue Distribution by Quarter",
-            color=quarter_stats.values,
-            color_continuous_scale='Blues'
-        )
-        fig_quarters.update_layout(
-            xaxis_title="Quarter",
-            yaxis_title="Number of Issues",
-            showlegend=False
-        )
-        st.plotly_chart(fig_quarters, use_container_width=True)
+        def build_quarters_chart():
+            fig_quarters = px.bar(
+                x=quarters,
+                y=quarter_stats.values,
+                title="Issue Distribution by Quarter",
+                color=quarter_stats.values,
+                color_continuous_scale='Blues'
+            )
+            fig_quarters.update_layout(
+                xaxis_title="Quarter",
+                yaxis_title="Number of Issues",
+                showlegend=False
+            )
+            return fig_quarters
+        
+        plotly_chart('quarters.counts', cube, (), build_quarters_chart)
     
     with col2:
         # Quarter completion status
         st.subheader("Quarter Completion Status")
         
-        quarter_status = df.groupby(['quarter', 'status']).size().unstack(fill_value=0)
+        quarter_status = cube.counts('quarter', 'status').unstack(fill_value=0)
         
         if 'Done' in quarter_status.columns:
             quarter_status['completion_rate'] = (
                 quarter_status['Done'] / quarter_status.sum(axis=1) * 100
             )
             
-            fig_completion = px.bar(
-                x=quarter_status.index,
-                y=quarter_status['completion_rate'],
-                title="Completion Rate by Quarter (%)",
-                color=quarter_status['completion_rate'],
-                color_continuous_scale='Greens'
-            )
-            fig_completion.update_layout(
-                xaxis_title="Quarter",
-                yaxis_title="Completion Rate (%)",
-                showlegend=False
-            )
-            st.plotly_chart(fig_completion, use_container_width=True)
+            def build_completion_chart():
+                fig_completion = px.bar(
+                    x=quarter_status.index,
+                    y=quarter_status['completion_rate'],
+                    title="Completion Rate by Quarter (%)",
+                    color=quarter_status['completion_rate'],
+                    color_continuous_scale='Greens'
+                )
+                fig_completion.update_layout(
+                    xaxis_title="Quarter",
+                    yaxis_title="Completion Rate (%)",
+                    showlegend=False
+                )
+                return fig_completion
+            
+            plotly_chart('quarters.completion', cube, (), build_completion_chart)
     
     # Quarter timeline with areas
     st.subheader("Quarter Timeline by Area")
     
     # Create quarter-area breakdown with proper sorting
-    quarter_area = df.groupby(['quarter', 'areas']).size().reset_index(name='count')
+    quarter_area = cube.counts('quarter', 'areas').reset_index()
     
     if not quarter_area.empty:
-        # Sort quarters chronologically
-        def sort_quarter_key(quarter):
-            if isinstance(quarter, str) and 'Q' in quarter:
-                parts = quarter.split(' ')
-                if len(parts) == 2:
-                    q_num = int(parts[0][1:])
-                    year = int(parts[1])
-                    return (year, q_num)
-            return (0, 0)
-        
-        quarter_area['sort_key'] = quarter_area['quarter'].apply(sort_quarter_key)
-        quarter_area = quarter_area.sort_values('sort_key').drop('sort_key', axis=1)
+        def build_timeline_chart():
+            fig_timeline = px.bar(
+                quarter_area,
+                x='quarter',
+                y='count',
+                color='areas',
+                title="Issues Timeline by Quarter and Area",
+                color_discrete_map=AREA_COLORS,
+                category_orders={'quarter': quarters}
+            )
+            fig_timeline.update_layout(
+                xaxis_title="Quarter",
+                yaxis_title="Number of Issues"
+            )
+            return fig_timeline
         
-        fig_timeline = px.bar(
-            quarter_area,
-            x='quarter',
-            y='count',
-            color='areas',
-            title="Issues Timeline by Quarter and Area",
-            color_discrete_map=AREA_COLORS,
-            category_orders={'quarter': sorted(quarter_area['quarter'].unique(), key=sort_quarter_key)}
-        )
-        fig_timeline.update_layout(
-            xaxis_title="Quarter",
-            yaxis_title="Number of Issues"
+        plotly_chart('quarters.area_timeline', cube, (), build_timeline_chart)
+    
+    # Quarter roadmap view - reruns on its own when its widgets change
+    _show_quarter_roadmap(df, cube, quarter_keys, current_key)
+    
+    # Quarter comparison
+    st.subheader("Quarter Comparison")
+    
+    prev_quarter = prev_quarter_metric
+    
+    # Slice the cube for the current and previous quarters
+    current_cube = cube.select(quarter_key=current_key)
+    previous_cube = cube.select(quarter_key=current_key - 1)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write(f"**{current_quarter} (Current)**")
+        st.metric("Total Issues", current_cube.count())
+        st.metric("Completed", current_cube.select(status='Done').count())
+        st.metric("In Progress", current_cube.select(status='In Progress').count())
+    
+    with col2:
+        st.write(f"**{prev_quarter} (Previous)**")
+        st.metric("Total Issues", previous_cube.count())
+        st.metric("Completed", previous_cube.select(status='Done').count())
+        st.metric("In Progress", previous_cube.select(status='In Progress').count())
+    
+    # Quarter comparison chart
+    comparison_data = pd.DataFrame({
+        'Quarter': [prev_quarter, current_quarter],
+        'Total Issues': [previous_cube.count(), current_cube.count()],
+        'Completed': [
+            previous_cube.select(status='Done').count(),
+            current_cube.select(status='Done').count()
+        ]
+    })
+    
+    def build_comparison_chart():
+        fig_comparison = px.bar(
+            comparison_data,
+            x='Quarter',
+            y=['Total Issues', 'Completed'],
+            title="Current vs Previous Quarter Comparison",
+            barmode='group'
         )
-        st.plotly_chart(fig_timeline, use_container_width=True)
+        return fig_comparison
     
-    # Quarter roadmap view
+    plotly_chart('quarters.comparison', cube, (current_quarter,), build_comparison_chart)
+
+
+@st.fragment
+def _show_quarter_roadmap(df, cube, quarter_keys, current_key):
+    """Quarter picker with the selected quarter's charts, filters and issues; quarters are picked by key"""
     st.subheader("Quarter Roadmap")
     
     # Quarter filters
     col1, col2 = st.columns(2)
     
     with col1:
-        # Predefined quarter options
-        predefined_quarters = [
-            "Q1 2025", "Q2 2025", "Q3 2025", "Q4 2025",
-            "Q1 2026", "Q2 2026", "Q3 2026", "Q4 2026"
-        ]
+        # Predefined quarter options, Q1 2025 to Q4 2026
+        predefined_quarters = range(2025 * 4, 2027 * 4)
         
-        # Get available quarters from data
-        available_quarters = sorted(df['quarter'].unique(), reverse=True)
+        # Get available quarters from data, latest first
+        available_quarters = quarter_keys[::-1]
         
         # Combine predefined with available quarters
         all_quarter_options = []
@@ -218,12 +234,14 @@ def show_quarters_dashboard(jira_client, project_key):
                 all_quarter_options.append(q)
         
         # Default to current quarter if available, otherwise first option
-        default_quarter = current_quarter if current_quarter in (all_quarter_options if all_quarter_options else available_quarters) else (all_quarter_options[0] if all_quarter_options else available_quarters[0])
+        default_quarter = current_key if current_key in (all_quarter_options if all_quarter_options else available_quarters) else (all_quarter_options[0] if all_quarter_options else available_quarters[0])
         
         selected_quarter = st.selectbox(
             "Select Quarter for Detailed View",
             options=all_quarter_options if all_quarter_options else available_quarters,
-            index=(all_quarter_options if all_quarter_options else available_quarters).index(default_quarter) if default_quarter in (all_quarter_options if all_quarter_options else available_quarters) else 0
+            index=(all_quarter_options if all_quarter_options else available_quarters).index(default_quarter) if default_quarter in (all_quarter_options if all_quarter_options else available_quarters) else 0,
+            format_func=quarter_label,
+            key="quarter_roadmap_quarter"
         )
     
     with col2:
@@ -231,39 +249,50 @@ def show_quarters_dashboard(jira_client, project_key):
         selected_quarters_multi = st.multiselect(
             "Select Quarters for Comparison",
             options=all_quarter_options if all_quarter_options else available_quarters,
-            default=all_quarter_options[:2] if len(all_quarter_options) >= 2 else available_quarters[:2]
+            default=all_quarter_options[:2] if len(all_quarter_options) >= 2 else available_quarters[:2],
+            format_func=quarter_label,
+            key="quarter_comparison_quarters"
         )
     
-    quarter_data = df[df['quarter'] == selected_quarter]
+    engine = FilterEngine(df, 'board')
+    quarter_data = engine.filter(quarter=[selected_quarter])
+    quarter_cube = cube.select(quarter_key=selected_quarter)
+    selected_label = quarter_label(selected_quarter)
     
     if not quarter_data.empty:
         col1, col2 = st.columns(2)
         
         with col1:
             # Status breakdown for selected quarter
-            status_counts = quarter_data['status'].value_counts()
+            status_counts = quarter_cube.counts('status')
             
-            fig_status = px.pie(
-                values=status_counts.values,
-                names=status_counts.index,
-                title=f"{selected_quarter} - Status Distribution"
-            )
-            st.plotly_chart(fig_status, use_container_width=True)
+            def build_status_chart():
+                fig_status = px.pie(
+                    values=status_counts.values,
+                    names=status_counts.index,
+                    title=f"{selected_label} - Status Distribution"
+                )
+                return fig_status
+            
+            plotly_chart('quarters.quarter_status', cube, (selected_quarter,), build_status_chart)
         
         with col2:
             # Area breakdown for selected quarter
-            area_counts = quarter_data['areas'].value_counts()
+            area_counts = quarter_cube.counts('areas')
             
-            fig_areas = px.pie(
-                values=area_counts.values,
-                names=area_counts.index,
-                title=f"{selected_quarter} - Area Distribution",
-                color_discrete_map=AREA_COLORS
-            )
-            st.plotly_chart(fig_areas, use_container_width=True)
+            def build_areas_chart():
+                fig_areas = px.pie(
+                    values=area_counts.values,
+                    names=area_counts.index,
+                    title=f"{selected_label} - Area Distribution",
+                    color_discrete_map=AREA_COLORS
+                )
+                return fig_areas
+            
+            plotly_chart('quarters.quarter_areas', cube, (selected_quarter,), build_areas_chart)
         
         # Detailed issues for selected quarter
-        st.subheader(f"Issues in {selected_quarter}")
+        st.subheader(f"Issues in {selected_label}")
         
         # Filter options
         col1, col2, col3 = st.columns(3)
@@ -271,35 +300,36 @@ def show_quarters_dashboard(jira_client, project_key):
         with col1:
             status_filter = st.multiselect(
                 "Filter by Status",
-                options=quarter_data['status'].unique(),
-                default=quarter_data['status'].unique(),
+                options=engine.options('status', quarter=[selected_quarter]),
+                default=engine.options('status', quarter=[selected_quarter]),
                 key="quarter_status_filter"
             )
         
         with col2:
             area_filter = st.multiselect(
                 "Filter by Area",
-                options=quarter_data['areas'].unique(),
-                default=quarter_data['areas'].unique(),
+                options=engine.options('areas', quarter=[selected_quarter]),
+                default=engine.options('areas', quarter=[selected_quarter]),
                 key="quarter_area_filter"
             )
         
         with col3:
             priority_filter = st.multiselect(
                 "Filter by Priority",
-                options=quarter_data['priority'].unique(),
-                default=quarter_data['priority'].unique(),
+                options=engine.options('priority', quarter=[selected_quarter]),
+                default=engine.options('priority', quarter=[selected_quarter]),
                 key="quarter_priority_filter"
             )
         
         # Apply filters
-        filtered_quarter_data = quarter_data[
-            (quarter_data['status'].isin(status_filter)) &
-            (quarter_data['areas'].isin(area_filter)) &
-            (quarter_data['priority'].isin(priority_filter))
-        ]
+        filtered_quarter_data = engine.filter(
+            quarter=[selected_quarter],
+            status=status_filter,
+            areas=area_filter,
+            priority=priority_filter
+        )
         
-        st.write(f"Showing {len(filtered_quarter_data)} issues in {selected_quarter}")
+        st.write(f"Showing {len(filtered_quarter_data)} issues in {selected_label}")
         
         if not filtered_quarter_data.empty:
             # Show debug info about dates
@@ -316,56 +346,3 @@ def show_quarters_dashboard(jira_client, project_key):
             )
         else:
             st.info("No issues match the selected filters.")
-    
-    # Quarter comparison
-    st.subheader("Quarter Comparison")
-    
-    # Calculate previous quarter based on current quarter
-    current_month = today.month
-    current_year = today.year
-    
-    if current_month <= 3:  # Q1
-        prev_quarter = f"Q4 {current_year - 1}"
-    elif current_month <= 6:  # Q2
-        prev_quarter = f"Q1 {current_year}"
-    elif current_month <= 9:  # Q3
-        prev_quarter = f"Q2 {current_year}"
-    else:  # Q4
-        prev_quarter = f"Q3 {current_year}"
-    
-    # Get data for current and previous quarters
-    current_data = df[df['quarter'] == current_quarter]
-    previous_data = df[df['quarter'] == prev_quarter]
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.write(f"**{current_quarter} (Current)**")
-        st.metric("Total Issues", len(current_data))
-        st.metric("Completed", len(current_data[current_data['status'] == 'Done']))
-        st.metric("In Progress", len(current_data[current_data['status'] == 'In Progress']))
-    
-    with col2:
-        st.write(f"**{prev_quarter} (Previous)**")
-        st.metric("Total Issues", len(previous_data))
-        st.metric("Completed", len(previous_data[previous_data['status'] == 'Done']))
-        st.metric("In Progress", len(previous_data[previous_data['status'] == 'In Progress']))
-    
-    # Quarter comparison chart
-    comparison_data = pd.DataFrame({
-        'Quarter': [prev_quarter, current_quarter],
-        'Total Issues': [len(previous_data), len(current_data)],
-        'Completed': [
-            len(previous_data[previous_data['status'] == 'Done']),
-            len(current_data[current_data['status'] == 'Done'])
-        ]
-    })
-    
-    fig_comparison = px.bar(
-        comparison_data,
-        x='Quarter',
-        y=['Total Issues', 'Completed'],
-        title="Current vs Previous Quarter Comparison",
-        barmode='group'
-    )
-    st.plotly_chart(fig_comparison, use_container_width=True)
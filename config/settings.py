@@ -33,6 +33,54 @@ JIRA_API_KEY = jira_config['api_key']
 JIRA_SERVER = jira_config['server']
 PROJECT_KEY = "AICP"
 
+# Jira search paging (Jira Cloud caps search pages at 100 issues)
+SEARCH_PAGE_SIZE = 100
+SEARCH_MAX_WORKERS = 8
+
+# HTTP connection pool shared by all requests to Jira for one credential
+HTTP_POOL_MAXSIZE = 16
+HTTP_TIMEOUT = 30
+HTTP_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Retry and rate limiting for Jira requests (the budget is shared by the whole process)
+HTTP_MAX_RETRIES = 4
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 30
+JIRA_REQUESTS_PER_SECOND = 10
+JIRA_REQUEST_BURST = 20
+
+# Incremental sync: data older than the refresh interval is still served while
+# issues updated since the last sync are fetched in the background, plus an
+# occasional key-only sweep of the project to drop deleted or moved issues
+SYNC_REFRESH_SECONDS = 300
+SYNC_OVERLAP_MINUTES = 2
+SYNC_SWEEP_SECONDS = 1800
+
+# Debug aid: print how much memory each column of a project's issue frame uses after a full scan
+ISSUE_MEMORY_REPORT = os.getenv('ISSUE_MEMORY_REPORT', '').lower() in ('1', 'true', 'yes')
+
+# Local SQLite issue store that survives restarts and cache clears
+ISSUE_STORE_PATH = os.getenv(
+    'ISSUE_STORE_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'issues.db')
+)
+
+# Arrow snapshots of processed issue frames, written after every sync and memory-mapped on cold start
+ISSUE_SNAPSHOT_DIR = os.getenv('ISSUE_SNAPSHOT_DIR', os.path.join(os.path.dirname(ISSUE_STORE_PATH), 'snapshots'))
+
+# Recent dashboard filter results kept per session
+FILTER_CACHE_SIZE = 64
+
+# Built Plotly figures reused while their data and parameters are unchanged
+FIGURE_CACHE_SIZE = 256
+
+# Gantt timelines: task rows are drawn a page at a time, and large timelines
+# open as swimlanes of active tasks per time bucket
+GANTT_PAGE_SIZE = 100
+GANTT_SWIMLANE_THRESHOLD = 300
+GANTT_MAX_LANES = 25
+GANTT_MAX_BUCKETS = 120
+
 # Dashboard Configuration
 AREAS = [
     "Desenvolvimento",
@@ -42,6 +90,16 @@ AREAS = [
     "DevOps"
 ]
 
+# Jira label fragments that put an issue in an area, matched case-insensitively.
+# A label belongs to the first area (in this order) with a matching fragment.
+AREA_ALIASES = {
+    "Desenvolvimento": ["desenvolvimento", "development"],
+    "DevOps": ["devops"],
+    "Qualidade": ["qualidade", "quality"],
+    "Dados": ["dados", "data"],
+    "Arquitetura": ["arquitetura", "architecture"]
+}
+
 PRIORITY_MAPPING = {
     "Highest": 5,
     "High": 4,
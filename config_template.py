@@ -4,11 +4,63 @@ Configuration Template for AICockpit Dashboard
 Copy this file to config/settings.py and update with your Jira details.
 """
 
+import os
+
 # Jira Configuration - UPDATE THESE VALUES
 JIRA_SERVER = "https://your-company.atlassian.net"  # Your Jira server URL
 PROJECT_KEY = "YOUR_PROJECT"  # Your project key (e.g., "AICP")
 BOARD_ID = 1234  # Your board ID number
 
+# Jira search paging (Jira Cloud caps search pages at 100 issues)
+SEARCH_PAGE_SIZE = 100  # Issues requested per search page
+SEARCH_MAX_WORKERS = 8  # Pages fetched concurrently after the first one
+
+# HTTP connection pool shared by all requests to Jira for one credential
+HTTP_POOL_MAXSIZE = 16  # Keep-alive connections kept open per credential
+HTTP_TIMEOUT = 30  # Seconds to wait for a Jira response
+HTTP_STREAM_CHUNK_SIZE = 64 * 1024  # Bytes of a search response parsed at a time
+
+# Retry and rate limiting for Jira requests (the budget is shared by the whole process)
+HTTP_MAX_RETRIES = 4  # Retries for 429/5xx responses and connection errors
+HTTP_BACKOFF_BASE = 0.5  # Seconds before the first retry, doubled on each attempt
+HTTP_BACKOFF_MAX = 30  # Longest wait between retries, in seconds
+JIRA_REQUESTS_PER_SECOND = 10  # Sustained request rate across all sessions
+JIRA_REQUEST_BURST = 20  # Requests allowed in a burst above that rate
+
+# Incremental sync: data older than the refresh interval is still served while
+# issues updated since the last sync are fetched in the background, plus an
+# occasional key-only sweep of the project to drop deleted or moved issues
+SYNC_REFRESH_SECONDS = 300  # Age after which data is refreshed in the background
+SYNC_OVERLAP_MINUTES = 2  # Extra minutes re-read on each sync to absorb clock skew
+SYNC_SWEEP_SECONDS = 1800  # How often to reconcile deletions, in seconds
+
+# Debug aid: print how much memory each column of a project's issue frame uses after a full scan
+ISSUE_MEMORY_REPORT = os.getenv('ISSUE_MEMORY_REPORT', '').lower() in ('1', 'true', 'yes')  # Off unless set
+
+# Local SQLite issue store that survives restarts and cache clears
+ISSUE_STORE_PATH = os.getenv(
+    'ISSUE_STORE_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'issues.db')
+)  # Defaults to .cache/issues.db in the project folder
+
+# Arrow snapshots of processed issue frames, written after every sync and memory-mapped on cold start
+ISSUE_SNAPSHOT_DIR = os.getenv(
+    'ISSUE_SNAPSHOT_DIR', os.path.join(os.path.dirname(ISSUE_STORE_PATH), 'snapshots')
+)  # Defaults to a snapshots folder next to the issue store
+
+# Dashboard filters answered from bitmap indexes
+FILTER_CACHE_SIZE = 64  # Filter results remembered per session
+
+# Built Plotly figures reused while their data and parameters are unchanged
+FIGURE_CACHE_SIZE = 256  # Plotly figures kept across sessions
+
+# Gantt timelines: task rows are drawn a page at a time, and large timelines
+# open as swimlanes of active tasks per time bucket
+GANTT_PAGE_SIZE = 100  # Task rows drawn per timeline page
+GANTT_SWIMLANE_THRESHOLD = 300  # Above this many tasks the timeline opens as swimlanes
+GANTT_MAX_LANES = 25  # Assignee lanes before the rest are grouped as 'Other'
+GANTT_MAX_BUCKETS = 120  # Most time buckets in a swimlane chart
+
 # Dashboard Configuration - Customize as needed
 AREAS = [
     "Desenvolvimento",  # Development
@@ -19,6 +71,17 @@ AREAS = [
     # Add or modify areas according to your project labels
 ]
 
+# Jira label fragments that put an issue in an area, matched case-insensitively.
+# A label belongs to the first area (in this order) with a matching fragment.
+AREA_ALIASES = {
+    "Desenvolvimento": ["desenvolvimento", "development"],
+    "DevOps": ["devops"],
+    "Qualidade": ["qualidade", "quality"],
+    "Dados": ["dados", "data"],
+    "Arquitetura": ["arquitetura", "architecture"]
+    # Add an entry for every area in AREAS; entries for other areas are ignored
+}
+
 PRIORITY_MAPPING = {
     "Highest": 5,
     "High": 4,
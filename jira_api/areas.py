@@ -0,0 +1,63 @@
+"""
+Label-to-area normalization built from the area alias table in the settings
+"""
+
+import re
+from functools import lru_cache
+import pandas as pd
+from config.settings import AREAS, AREA_ALIASES
+from jira_api.fields import AREA_BITS
+
+
+def _compile_aliases(aliases):
+    """Compile one case-insensitive pattern per configured area, keeping the table's precedence"""
+    patterns = []
+    for area, fragments in aliases.items():
+        if area not in AREAS:
+            print(f"DEBUG: Ignoring label aliases for {area}, which is not in AREAS")
+            continue
+        if fragments:
+            patterns.append((area, re.compile('|'.join(re.escape(fragment) for fragment in fragments), re.IGNORECASE)))
+    return patterns
+
+
+AREA_PATTERNS = _compile_aliases(AREA_ALIASES)
+
+
+@lru_cache(maxsize=4096)
+def _label_area(label):
+    """Area a single label belongs to, or None"""
+    for area, pattern in AREA_PATTERNS:
+        if pattern.search(label):
+            return area
+    return None
+
+
+# Projects only use a few hundred label combinations, so most issues are a cache hit
+@lru_cache(maxsize=4096)
+def area_summary(labels):
+    """Return (areas string, area_mask) for a tuple of Jira labels, areas listed in AREAS order"""
+    mask = 0
+    for label in labels:
+        area = _label_area(str(label))
+        if area is not None:
+            mask |= AREA_BITS[area]
+
+    areas = [area for area in AREAS if mask & AREA_BITS[area]]
+    return (', '.join(areas) if areas else 'No Area'), mask
+
+
+def area_membership(area_mask):
+    """Boolean issue x area matrix built from an area_mask column, with 'No Area' as the last column"""
+    membership = {area: (area_mask & bit) != 0 for area, bit in AREA_BITS.items()}
+    membership['No Area'] = area_mask == 0
+    return pd.DataFrame(membership, index=area_mask.index)
+
+
+def area_filter(area_mask, selected_areas):
+    """Mask of the issues in any of the selected areas; 'No Area' selects issues without one"""
+    bits = sum(AREA_BITS[area] for area in selected_areas if area in AREA_BITS)
+    mask = (area_mask & bits) != 0
+    if 'No Area' in selected_areas:
+        mask |= area_mask == 0
+    return mask
@@ -7,6 +7,8 @@ import pandas as pd
 from jira import JIRA
 from datetime import datetime, timedelta
 from config.settings import JIRA_SERVER, PROJECT_KEY, AREAS
+from jira_api.areas import area_filter, area_summary
+from jira_api.fields import ISSUE_COLUMNS, ISSUE_FIELDS, apply_schema, quarter_label
 
 
 class JiraClient:
@@ -40,7 +42,7 @@ class JiraClient:
             # Get issues from each label query
             for query in label_queries:
                 try:
-                    label_issues = _self.jira.search_issues(query, maxResults=500, fields='*all')
+                    label_issues = _self.jira.search_issues(query, maxResults=500, fields=ISSUE_FIELDS)
                     for issue in label_issues:
                         if issue.key not in existing_keys:
                             all_issues.append(issue)
@@ -54,8 +56,7 @@ class JiraClient:
                 aicp_issues = _self.jira.search_issues(
                     f'project = {PROJECT_KEY}',
                     maxResults=1000,
-                    expand='changelog',
-                    fields='*all'
+                    fields=ISSUE_FIELDS
                 )
                 for issue in aicp_issues:
                     if issue.key not in existing_keys:
@@ -68,26 +69,9 @@ class JiraClient:
             
             issues_data = []
             for issue in issues:
-                # Extract and filter labels from Jira issue
-                all_labels = [str(label) for label in issue.fields.labels] if issue.fields.labels else []
-                
-                # Filter and normalize labels to only show configured areas
-                filtered_labels = []
-                for label in all_labels:
-                    label_lower = label.lower()
-                    if 'desenvolvimento' in label_lower or 'development' in label_lower:
-                        filtered_labels.append('Desenvolvimento')
-                    elif 'devops' in label_lower:  # This will catch both DevOps and DEVOPS
-                        filtered_labels.append('DevOps')
-                    elif 'qualidade' in label_lower or 'quality' in label_lower:
-                        filtered_labels.append('Qualidade')
-                    elif 'dados' in label_lower or 'data' in label_lower:
-                        filtered_labels.append('Dados')
-                    elif 'arquitetura' in label_lower or 'architecture' in label_lower:
-                        filtered_labels.append('Arquitetura')
-                
-                # Remove duplicates and keep only our configured areas
-                labels = list(set(filtered_labels))
+                # Map labels to configured areas (memoized per label combination)
+                labels = tuple(str(label) for label in issue.fields.labels) if issue.fields.labels else ()
+                areas, area_mask = area_summary(labels)
                 
                 # Get assignee info
                 assignee = issue.fields.assignee.displayName if issue.fields.assignee else "Unassigned"
@@ -123,55 +107,41 @@ class JiraClient:
                             start_date = None
                 
                 # Determine quarter based on start date if available, otherwise created date
-                if start_date:
-                    quarter = _self._get_quarter(start_date)
-                else:
-                    quarter = _self._get_quarter(created)
+                quarter_date = start_date if start_date else created
+                quarter = quarter_date.year * 4 + (quarter_date.month - 1) // 3
                 
                 # Only include issues that have at least one of our configured areas
-                if labels:  # Skip issues with no matching area labels
+                if area_mask:  # Skip issues with no matching area labels
                     issue_data = {
                         'key': issue.key,
                         'summary': issue.fields.summary,
                         'status': issue.fields.status.name,
                         'priority': issue.fields.priority.name if issue.fields.priority else 'Medium',
                         'assignee': assignee,
-                        'reporter': issue.fields.reporter.displayName if issue.fields.reporter else 'Unknown',
+                        'reporter': issue.fields.reporter.displayName if getattr(issue.fields, 'reporter', None) else 'Unknown',
                         'issue_type': issue.fields.issuetype.name,
-                        'labels': labels,
-                        'areas': ', '.join(labels),
+                        'areas': areas,
+                        'area_mask': area_mask,
                         'created': created,
                         'updated': updated,
                         'due_date': due_date,
                         'start_date': start_date,
-                        'quarter': quarter,
+                        'quarter': quarter_label(quarter),
+                        'quarter_key': quarter,
                         'is_bug': issue.fields.issuetype.name.lower() in ['bug', 'defect', 'error'],
                         'story_points': getattr(issue.fields, 'customfield_10016', None),  # Common story points field
-                        'description': issue.fields.description[:200] + '...' if issue.fields.description else ''
+                        'description': issue.fields.description[:200] + '...' if getattr(issue.fields, 'description', None) else ''
                     }
                     
                     issues_data.append(issue_data)
             
-            return pd.DataFrame(issues_data)
+            # Only keep the columns whose Jira fields were requested, in their compact dtypes
+            return apply_schema(pd.DataFrame(issues_data, columns=ISSUE_COLUMNS))
             
         except Exception as e:
             st.error(f"Error fetching issues: {str(e)}")
             return pd.DataFrame()
     
-    def _get_quarter(self, date):
-        """Determine quarter from date"""
-        month = date.month
-        year = date.year
-        
-        if month <= 3:
-            return f"Q1 {year}"
-        elif month <= 6:
-            return f"Q2 {year}"
-        elif month <= 9:
-            return f"Q3 {year}"
-        else:
-            return f"Q4 {year}"
-    
     @st.cache_data(ttl=300)
     def get_project_statistics(_self):
         """Get project statistics and metrics"""
@@ -205,30 +175,21 @@ class JiraClient:
             if df.empty:
                 return pd.DataFrame()
             
-            # Filter by selected areas if provided - Fixed for multi-area issues
+            # Filter by selected areas if provided
             if selected_areas:
-                def check_area_match(areas_string):
-                    if areas_string == 'No Area':
-                        return 'No Area' in selected_areas
-                    else:
-                        # Split the areas and check if any selected area is in the issue's areas
-                        issue_areas = [area.strip() for area in areas_string.split(',')]
-                        return any(selected_area in issue_areas for selected_area in selected_areas)
-                
-                area_mask = df['areas'].apply(check_area_match)
-                df = df[area_mask]
+                df = df[area_filter(df['area_mask'], selected_areas)]
             
             # Prepare Gantt data
             gantt_data = []
             for _, row in df.iterrows():
                 # Use custom start date if available, otherwise use created date
-                if row['start_date']:
+                if pd.notna(row['start_date']):
                     start_date = row['start_date']
                 else:
                     start_date = row['created']
                 
                 # Use due date or estimate end date
-                if row['due_date']:
+                if pd.notna(row['due_date']):
                     end_date = row['due_date']
                 else:
                     # Estimate 2 weeks for tasks without due date
@@ -246,7 +207,8 @@ class JiraClient:
                     'Priority': row['priority'],
                     'Assignee': row['assignee'],
                     'Summary': row['summary'],
-                    'Key': row['key']
+                    'Key': row['key'],
+                    'AreaMask': row['area_mask']
                 })
             
             return pd.DataFrame(gantt_data)
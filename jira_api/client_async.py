@@ -0,0 +1,231 @@
+"""
+Asyncio-based Jira client that fans out every search and page of a page load concurrently
+"""
+
+import asyncio
+import base64
+import threading
+import httpx
+from config.settings import (
+    JIRA_SERVER, SEARCH_PAGE_SIZE, SEARCH_MAX_WORKERS, HTTP_POOL_MAXSIZE, HTTP_TIMEOUT,
+    HTTP_STREAM_CHUNK_SIZE, HTTP_MAX_RETRIES
+)
+from jira_api.client_requests import JiraClientRequests, IssueRows
+from jira_api.fields import ISSUE_FIELDS
+from jira_api.streaming import parse_search_response_async
+from jira_api.transport import (
+    RETRYABLE_STATUS_CODES, _request_budget, _backoff_delay, _rate_limit_delay, _credential_key
+)
+
+
+class AsyncJiraTransport:
+    def __init__(self, email, api_key):
+        """Open a pooled async HTTP client authenticated with the given credentials"""
+        auth_str = f'{email}:{api_key}'
+        auth_b64 = base64.b64encode(auth_str.encode('ascii')).decode('ascii')
+
+        self.client = httpx.AsyncClient(
+            base_url=f'{JIRA_SERVER}/rest/api/2/',
+            headers={
+                'Authorization': f'Basic {auth_b64}',
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, deflate',
+                'Content-Type': 'application/json'
+            },
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(max_connections=HTTP_POOL_MAXSIZE, max_keepalive_connections=HTTP_POOL_MAXSIZE)
+        )
+
+    async def get(self, endpoint, params=None, on_issue=None):
+        """GET a Jira REST endpoint and return the decoded JSON body, retrying transient failures"""
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            # The request budget is shared with the requests-based transport
+            await _request_budget.acquire_async()
+            try:
+                request = self.client.build_request('GET', endpoint, params=params)
+                response = await self.client.send(request, stream=on_issue is not None)
+            except httpx.TransportError:
+                if attempt == HTTP_MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+
+            try:
+                delay = _rate_limit_delay(response)
+                if delay:
+                    _request_budget.pause(delay)
+
+                if response.status_code in RETRYABLE_STATUS_CODES and attempt < HTTP_MAX_RETRIES:
+                    await asyncio.sleep(delay or _backoff_delay(attempt))
+                    continue
+
+                response.raise_for_status()
+                if on_issue is None:
+                    return response.json()
+
+                # Search pages are streamed and held until they parse, like in JiraTransport.get
+                page = []
+                try:
+                    metadata = await parse_search_response_async(
+                        response.aiter_bytes(HTTP_STREAM_CHUNK_SIZE), page.append
+                    )
+                except httpx.TransportError:
+                    if attempt == HTTP_MAX_RETRIES:
+                        raise
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    continue
+            finally:
+                await response.aclose()
+
+            for issue in page:
+                on_issue(issue)
+            return metadata
+
+    async def close(self):
+        """Close every pooled connection"""
+        await self.client.aclose()
+
+
+class AsyncJiraClientRequests:
+    def __init__(self, email, api_key):
+        """Initialize async Jira client with credentials"""
+        self.email = email
+        self.api_key = api_key
+        self.transport = get_async_transport(email, api_key)
+
+    def close(self):
+        """Give up this client's share of the async transport; calling it again does nothing"""
+        if self.transport is not None:
+            self.transport = None
+            release_async_transport(self.email, self.api_key)
+
+    async def _make_request(self, limit, endpoint, params=None, on_issue=None):
+        """Make authenticated request to Jira API, holding one of the page load's concurrency slots"""
+        async with limit:
+            return await self.transport.get(endpoint, params, on_issue)
+
+    async def search_issues(self, jql, fields=ISSUE_FIELDS, limit=None):
+        """Fetch every issue matching a JQL query into IssueRows, requesting all pages after the first at once"""
+        if limit is None:
+            limit = asyncio.Semaphore(SEARCH_MAX_WORKERS)
+
+        rows = IssueRows(fields)
+        first_page = await self._make_request(limit, 'search', {
+            'jql': jql,
+            'startAt': 0,
+            'maxResults': SEARCH_PAGE_SIZE,
+            'fields': fields
+        }, rows.add)
+
+        total = first_page.get('total', len(rows))
+
+        # The server may clamp maxResults, so page by what it actually returned
+        page_size = first_page.get('maxResults') or len(rows)
+        if not rows or page_size <= 0 or len(rows) >= total:
+            rows.check_total(total, jql)
+            return rows
+
+        pages = await asyncio.gather(*(
+            self._fetch_issue_range(limit, jql, fields, start, min(start + page_size, total))
+            for start in range(len(rows), total, page_size)
+        ))
+        for page in pages:
+            rows.extend(page)
+
+        rows.check_total(total, jql)
+        return rows
+
+    async def _fetch_issue_range(self, limit, jql, fields, start, end):
+        """Fetch issues [start, end) of a search, following short pages until the range is filled"""
+        rows = IssueRows(fields)
+        while start < end:
+            fetched = len(rows)
+            await self._make_request(limit, 'search', {
+                'jql': jql,
+                'startAt': start,
+                'maxResults': end - start,
+                'fields': fields
+            }, rows.add)
+            if len(rows) == fetched:
+                print(f"DEBUG: No issues returned for {jql} at startAt={start}")
+                break
+
+            start += len(rows) - fetched
+
+        return rows
+
+    async def search_many(self, queries):
+        """Run several (jql, fields) searches together under one concurrency cap"""
+        limit = asyncio.Semaphore(SEARCH_MAX_WORKERS)
+        return list(await asyncio.gather(*(
+            self.search_issues(jql, fields, limit) for jql, fields in queries
+        )))
+
+
+class JiraClientAsync(JiraClientRequests):
+    def __init__(self, email, api_key):
+        """Synchronous facade over AsyncJiraClientRequests with the same methods as JiraClientRequests"""
+        super().__init__(email, api_key)
+        self.async_client = AsyncJiraClientRequests(email, api_key)
+
+    def _search_issues(self, jql, fields=ISSUE_FIELDS):
+        """Fetch every issue matching a JQL query on the shared event loop"""
+        return run_sync(self.async_client.search_issues(jql, fields))
+
+    def _search_many(self, queries):
+        """Run several (jql, fields) searches concurrently on the shared event loop"""
+        return run_sync(self.async_client.search_many(queries))
+
+    def close(self):
+        """Release the async transport on logout; other sessions with the same credentials keep using it"""
+        super().close()
+        self.async_client.close()
+
+
+# A single event loop thread serves every session, so async clients outlive reruns
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop():
+    """Return the background event loop, starting it on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='jira-async-loop', daemon=True).start()
+        return _loop
+
+
+def run_sync(coroutine):
+    """Run a coroutine on the background event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_loop()).result()
+
+
+# Credential key -> [transport, number of clients using it]; every session logged in
+# with the same credentials shares one transport, so it is closed with its last client
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def get_async_transport(email, api_key):
+    """Return the shared async transport for a credential, counting the caller as one of its clients"""
+    key = _credential_key(email, api_key)
+    with _transports_lock:
+        if key not in _transports:
+            _transports[key] = [AsyncJiraTransport(email, api_key), 0]
+        _transports[key][1] += 1
+        return _transports[key][0]
+
+
+def release_async_transport(email, api_key):
+    """Drop one client of a credential's async transport, closing it once no client is left"""
+    key = _credential_key(email, api_key)
+    with _transports_lock:
+        if key not in _transports:
+            return
+        _transports[key][1] -= 1
+        if _transports[key][1] > 0:
+            return
+        transport, _ = _transports.pop(key)
+    run_sync(transport.close())
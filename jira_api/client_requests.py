@@ -5,9 +5,147 @@ Alternative Jira API client using requests library instead of jira library
 import streamlit as st
 import pandas as pd
 import requests
-import base64
-from datetime import datetime, timedelta
-from config.settings import JIRA_SERVER, PROJECT_KEY, AREAS
+import re
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from config.settings import PROJECT_KEY, AREAS, SEARCH_PAGE_SIZE, SEARCH_MAX_WORKERS
+from jira_api.areas import area_filter, area_summary
+from jira_api.cube import build_cube
+from jira_api.fields import COLUMN_FIELDS, ISSUE_COLUMNS, ISSUE_FIELDS, apply_schema
+from jira_api.sync import get_project_sync
+from jira_api.transport import get_transport, _credential_key
+
+
+# JQL fields that a project scan can answer locally, mapped to the DataFrame column they filter
+LOCAL_JQL_FIELDS = {
+    'issuetype': 'issue_type',
+    'status': 'status',
+    'priority': 'priority'
+}
+
+JQL_CLAUSE_PATTERN = re.compile(
+    r'^\s*(\w+)\s*(?:=\s*(?:"([^"]*)"|([\w-]+))|in\s*\(([^)]*)\))\s*$',
+    re.IGNORECASE
+)
+
+
+def _parse_jql(jql):
+    """Split a JQL conjunction into (field, values) clauses, or return None if it is anything else"""
+    clauses = []
+    for clause in re.split(r'\s+AND\s+', jql, flags=re.IGNORECASE):
+        match = JQL_CLAUSE_PATTERN.match(clause)
+        if not match:
+            return None
+        
+        field, quoted, bare, value_list = match.groups()
+        if value_list is not None:
+            values = [value.strip().strip('"') for value in value_list.split(',')]
+        else:
+            values = [quoted if quoted is not None else bare]
+        clauses.append((field.lower(), values))
+    return clauses
+
+
+def _plan_query(jql):
+    """Return (project_key, filters) if a query is subsumed by a project scan, otherwise None"""
+    clauses = _parse_jql(jql)
+    if clauses is None:
+        return None
+    
+    projects = [values for field, values in clauses if field == 'project']
+    if len(projects) != 1 or len(projects[0]) != 1:
+        return None
+    
+    filters = {}
+    for field, values in clauses:
+        if field == 'project':
+            continue
+        if field not in LOCAL_JQL_FIELDS or LOCAL_JQL_FIELDS[field] in filters:
+            return None
+        filters[LOCAL_JQL_FIELDS[field]] = values
+    
+    return projects[0][0], filters
+
+
+# Every Jira field _process_issues knows how to turn into a column
+PROCESSED_FIELDS = list(dict.fromkeys(field for fields in COLUMN_FIELDS.values() for field in fields))
+
+
+def _parse_dates(values):
+    """Parse a column of Jira dates, trying ISO timestamps first and RFC-2822 ones for the rest"""
+    dates = pd.to_datetime(values.str[:19], format='ISO8601', errors='coerce')
+    unparsed = dates.isna() & values.notna()
+    if unparsed.any():
+        dates[unparsed] = pd.to_datetime(values[unparsed].str[:25], format='%a, %d %b %Y %H:%M:%S', errors='coerce')
+    return dates
+
+
+# Object-valued Jira fields -> the attribute _process_issues reads, and its value when the object lacks it
+FIELD_ATTRIBUTES = {
+    'status': ('name', None),
+    'priority': ('name', None),
+    'issuetype': ('name', None),
+    'assignee': ('displayName', 'Unknown'),
+    'reporter': ('displayName', 'Unknown')
+}
+
+
+def _field_value(field, value):
+    """Reduce a raw field value to the scalar _process_issues needs, dropping icons, avatars and categories"""
+    if value is None:
+        return None
+    if field in FIELD_ATTRIBUTES:
+        attribute, default = FIELD_ATTRIBUTES[field]
+        value = value.get(attribute)
+        return default if value is None else value
+    if field == 'labels':
+        return tuple(value)
+    return value
+
+
+class IssueRows:
+    def __init__(self, fields=ISSUE_FIELDS):
+        """Columnar accumulator holding only the requested fields of each issue added to it"""
+        self.fields = [field for field in fields.split(',') if field != 'key']
+        self.keys = []
+        self.columns = {field: [] for field in self.fields}
+        self.seen = set()
+        self.total = None
+    
+    def __len__(self):
+        """Number of issues held"""
+        return len(self.keys)
+    
+    def add(self, issue_data):
+        """Extract one raw issue; only the scalars the frame is built from are kept, not the issue dict"""
+        fields = issue_data.get('fields', {})
+        self.keys.append(issue_data['key'])
+        self.seen.add(issue_data['key'])
+        for field, values in self.columns.items():
+            values.append(_field_value(field, fields.get(field)))
+    
+    def extend(self, other):
+        """Append the rows of another page, skipping issues already seen on an earlier page"""
+        # Issues repeat across pages when they shift while we page
+        for index, key in enumerate(other.keys):
+            if key in self.seen:
+                continue
+            self.keys.append(key)
+            self.seen.add(key)
+            for field, values in self.columns.items():
+                values.append(other.columns[field][index])
+    
+    def check_total(self, total, jql):
+        """Record how many issues Jira announced, reporting searches that returned fewer"""
+        self.total = total
+        if len(self) < total:
+            print(f"DEBUG: Expected {total} issues for {jql}, got {len(self)}")
+    
+    def complete(self):
+        """Whether every issue Jira announced for the search was received"""
+        return self.total is not None and len(self) >= self.total
 
 
 class JiraClientRequests:
@@ -16,276 +154,329 @@ class JiraClientRequests:
         self.email = email
         self.api_key = api_key
         
-        # Create auth header
-        auth_str = f'{email}:{api_key}'
-        auth_bytes = auth_str.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        self.headers = {
-            'Authorization': f'Basic {auth_b64}',
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        }
+        # Reuse the pooled keep-alive session shared by everyone logged in with these credentials
+        self.transport = get_transport(email, api_key)
+    
+    def close(self):
+        """Release what this client holds on logout; the pooled session is closed per credential"""
     
-    def _make_request(self, endpoint, params=None):
-        """Make authenticated request to Jira API"""
+    def _make_request(self, endpoint, params=None, on_issue=None):
+        """Make authenticated request to Jira API, raising once retries are exhausted"""
         try:
-            url = f'{JIRA_SERVER}/rest/api/2/{endpoint}'
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            return self.transport.get(endpoint, params, on_issue)
         except requests.exceptions.RequestException as e:
+            # Raise instead of returning nothing so a failed page never becomes a cached partial dataset
             print(f"API request failed: {e}")
-            return None
+            raise
+    
+    def _search_issues(self, jql, fields=ISSUE_FIELDS):
+        """Fetch every issue matching a JQL query into IssueRows, paging through the results in parallel"""
+        # Pages are streamed into columns, so raw issue JSON never outlives its own page
+        rows = IssueRows(fields)
+        first_page = self._make_request('search', {
+            'jql': jql,
+            'startAt': 0,
+            'maxResults': SEARCH_PAGE_SIZE,
+            'fields': fields
+        }, rows.add)
+        
+        total = first_page.get('total', len(rows))
+        
+        # The server may clamp maxResults, so page by what it actually returned
+        page_size = first_page.get('maxResults') or len(rows)
+        if not rows or page_size <= 0 or len(rows) >= total:
+            rows.check_total(total, jql)
+            return rows
+        
+        # Fetch the remaining pages concurrently and keep them in startAt order
+        offsets = range(len(rows), total, page_size)
+        with ThreadPoolExecutor(max_workers=SEARCH_MAX_WORKERS) as executor:
+            pages = executor.map(
+                lambda start: self._fetch_issue_range(jql, fields, start, min(start + page_size, total)),
+                offsets
+            )
+            for page in pages:
+                rows.extend(page)
+        
+        rows.check_total(total, jql)
+        return rows
+    
+    def _search_many(self, queries):
+        """Run several (jql, fields) searches at once and return their IssueRows in order"""
+        with ThreadPoolExecutor(max_workers=len(queries) or 1) as executor:
+            return list(executor.map(lambda query: self._search_issues(*query), queries))
+    
+    def _fetch_issue_range(self, jql, fields, start, end):
+        """Fetch issues [start, end) of a search, following short pages until the range is filled"""
+        rows = IssueRows(fields)
+        while start < end:
+            fetched = len(rows)
+            self._make_request('search', {
+                'jql': jql,
+                'startAt': start,
+                'maxResults': end - start,
+                'fields': fields
+            }, rows.add)
+            if len(rows) == fetched:
+                print(f"DEBUG: No issues returned for {jql} at startAt={start}")
+                break
+            
+            start += len(rows) - fetched
+        
+        return rows
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
-    def get_board_issues(_self, project_key=PROJECT_KEY):
+    def _visibility(self, project_key):
+        """Fingerprint of what this user may see in a project; users with equal fingerprints share its datasets"""
+        return self._fetch_visibility(_credential_key(self.email, self.api_key), project_key)
+    
+    @st.cache_data(ttl=3600)
+    def _fetch_visibility(_self, credential_key, project_key):
+        """Hash the memberships, project permission and security levels deciding what a user sees"""
+        user_scope = f'user-{credential_key}'
+        try:
+            myself = _self._make_request('myself', {'expand': 'groups,applicationRoles'})
+            permissions = _self._make_request('mypermissions', {
+                'projectKey': project_key,
+                'permissions': 'BROWSE_PROJECTS'
+            })
+            # Only the levels this user holds are listed, which covers per-issue security grants
+            security_levels = _self._make_request(f'project/{project_key}/securitylevel')
+        except Exception as e:
+            print(f"DEBUG: Visibility probe failed, not sharing datasets for this user: {e}")
+            return user_scope
+        
+        groups = myself.get('groups', {})
+        roles = myself.get('applicationRoles', {})
+        if len(groups.get('items', [])) < groups.get('size', 0) or len(roles.get('items', [])) < roles.get('size', 0):
+            # A truncated membership list cannot prove two users see the same issues
+            return user_scope
+        
+        browse = permissions.get('permissions', {}).get('BROWSE_PROJECTS', {})
+        if not browse.get('havePermission'):
+            return user_scope
+        
+        membership = json.dumps([
+            project_key,
+            myself.get('accountType'),
+            sorted(group['name'] for group in groups.get('items', [])),
+            sorted(role['key'] for role in roles.get('items', [])),
+            sorted(str(level.get('id')) for level in security_levels.get('levels', []))
+        ])
+        return hashlib.sha256(membership.encode('utf-8')).hexdigest()
+    
+    def _project_sync(self, project_key):
+        """Sync state of a project as this user sees it"""
+        # Keyed by user too, so a fingerprint nobody resolves to any more can be pruned
+        user = _credential_key(self.email, self.api_key)
+        return get_project_sync(project_key, self._visibility(project_key), user)
+    
+    def _scan_project(self, project_key):
+        """Fetch every issue of a project with the data version of that scan; dashboard datasets are derived from it"""
+        # Served from memory and refreshed in the background once stale; after the first
+        # scan only issues updated since the previous sync are downloaded
+        sync = self._project_sync(project_key)
+        frame, version = sync.get(self)
+        return frame, f'{project_key}:{sync.visibility}:{version}'
+    
+    def refresh_project(self, project_key=PROJECT_KEY):
+        """Sync a project now instead of waiting for the background refresh"""
+        self._project_sync(project_key).refresh(self)
+    
+    def get_data_status(self, project_key=PROJECT_KEY):
+        """When the served dataset was synced and whether a background refresh is running"""
+        sync = self._project_sync(project_key)
+        return {'synced_at': sync.watermark, 'refreshing': sync.refreshing}
+    
+    def _query(self, jql):
+        """Answer a JQL query from the project scan when it is subsumed, otherwise ask Jira directly"""
+        plan = _plan_query(jql)
+        if plan is None:
+            # Not a synced dataset, so it has no data version and nothing caches it by one
+            return self._process_issues(self._search_issues(jql))
+        
+        project_key, filters = plan
+        scan, data_version = self._scan_project(project_key)
+        if scan.empty or not filters:
+            # The scan is shared between sessions, so callers get their own copy
+            df = scan.copy()
+        else:
+            mask = pd.Series(True, index=scan.index)
+            for column, values in filters.items():
+                mask &= scan[column].str.lower().isin([value.lower() for value in values])
+            # Re-applying the schema drops the categories the subset no longer uses
+            df = apply_schema(scan[mask].reset_index(drop=True))
+        
+        # Caches of anything derived from the frame are keyed by the version it was read at
+        df.attrs['data_version'] = data_version
+        return df
+    
+    def get_board_issues(self, project_key=PROJECT_KEY):
         """Fetch all issues from the board for a specific project"""
         try:
-            all_issues = []
-            
-            # Search for issues with specific labels within the project
-            label_queries = [
-                f'project = "{project_key}" AND labels = "DevOps"',
-                f'project = "{project_key}" AND labels = "Arquitetura"',
-                f'project = "{project_key}" AND labels = "Desenvolvimento"',
-                f'project = "{project_key}" AND labels = "Dados"',
-                f'project = "{project_key}" AND labels = "Qualidade"'
-            ]
-            
-            existing_keys = set()
-            
-            # Get issues from each label query
-            for query in label_queries:
-                try:
-                    search_data = _self._make_request('search', {
-                        'jql': query,
-                        'maxResults': 500,
-                        'fields': '*all'
-                    })
-                    
-                    if search_data and 'issues' in search_data:
-                        for issue_data in search_data['issues']:
-                            if issue_data['key'] not in existing_keys:
-                                all_issues.append(issue_data)
-                                existing_keys.add(issue_data['key'])
-                except Exception as e:
-                    print(f"DEBUG: Failed to search for {query}: {e}")
-                    continue
-            
-            # Also get issues from the project that might not have area labels
-            try:
-                search_data = _self._make_request('search', {
-                    'jql': f'project = "{project_key}"',
-                    'maxResults': 1000,
-                    'fields': '*all'
-                })
-                
-                if search_data and 'issues' in search_data:
-                    for issue_data in search_data['issues']:
-                        if issue_data['key'] not in existing_keys:
-                            all_issues.append(issue_data)
-                            existing_keys.add(issue_data['key'])
-            except Exception as e:
-                print(f"DEBUG: Failed to search project {project_key}: {e}")
-            
-            return _self._process_issues(all_issues)
-            
+            # Every per-area label query is a subset of the project, so a single scan covers them
+            return self._query(f'project = "{project_key}"')
         except Exception as e:
             st.error(f"Error fetching issues: {str(e)}")
             return pd.DataFrame()
 
-    def _process_issues(_self, issues_list):
-        """Process a list of issues into a DataFrame"""
-        issues_data = []
-        for issue_data in issues_list:
-            try:
-                fields = issue_data['fields']
-                
-                # Extract labels
-                all_labels = [str(label) for label in fields.get('labels', [])]
-                
-                # Filter and normalize labels
-                filtered_labels = []
-                for label in all_labels:
-                    label_lower = label.lower()
-                    if 'desenvolvimento' in label_lower or 'development' in label_lower:
-                        filtered_labels.append('Desenvolvimento')
-                    elif 'devops' in label_lower:
-                        filtered_labels.append('DevOps')
-                    elif 'qualidade' in label_lower or 'quality' in label_lower:
-                        filtered_labels.append('Qualidade')
-                    elif 'dados' in label_lower or 'data' in label_lower:
-                        filtered_labels.append('Dados')
-                    elif 'arquitetura' in label_lower or 'architecture' in label_lower:
-                        filtered_labels.append('Arquitetura')
-                
-                labels = list(set(filtered_labels))
-                
-                # Get assignee
-                assignee = "Unassigned"
-                if fields.get('assignee'):
-                    assignee = fields['assignee'].get('displayName', 'Unknown')
-                
-                # Get dates
-                created = datetime.strptime(fields['created'][:19], '%Y-%m-%dT%H:%M:%S')
-                updated = datetime.strptime(fields['updated'][:19], '%Y-%m-%dT%H:%M:%S')
-                
-                # Get due date
-                due_date = None
-                if fields.get('duedate'):
-                    try:
-                        due_date = datetime.strptime(fields['duedate'], '%Y-%m-%d')
-                    except:
-                        due_date = None
-                
-                # Get start date from custom field
-                start_date = None
-                if fields.get('customfield_11317'):
-                    try:
-                        start_date = datetime.strptime(fields['customfield_11317'], '%Y-%m-%d')
-                    except:
-                        start_date = None
-                
-                # Determine quarter
-                quarter_date = start_date if start_date else created
-                quarter = _self._get_quarter(quarter_date)
-                
-                # Process all issues, assigning 'No Area' if no labels match
-                issue_info = {
-                    'key': issue_data['key'],
-                    'summary': fields['summary'],
-                    'status': fields['status']['name'],
-                    'priority': fields['priority']['name'] if fields.get('priority') else 'Medium',
-                    'assignee': assignee,
-                    'reporter': fields['reporter']['displayName'] if fields.get('reporter') else 'Unknown',
-                    'issue_type': fields['issuetype']['name'],
-                    'labels': labels,
-                    'areas': ', '.join(labels) if labels else 'No Area',
-                    'created': created,
-                    'updated': updated,
-                    'due_date': due_date,
-                    'start_date': start_date,
-                    'quarter': quarter,
-                    'is_bug': fields['issuetype']['name'].lower() in ['bug', 'defect', 'error'],
-                    'story_points': fields.get('customfield_10016'),
-                    'description': fields.get('description', '')[:200] + '...' if fields.get('description') else ''
-                }
-                issues_data.append(issue_info)
-                    
-            except Exception as e:
-                print(f"Error processing issue {issue_data.get('key', 'unknown')}: {e}")
-                continue
+    def _process_issues(_self, rows):
+        """Process fetched IssueRows into a DataFrame, building it column by column"""
+        if not rows:
+            return apply_schema(pd.DataFrame(columns=ISSUE_COLUMNS))
         
-        return pd.DataFrame(issues_data)
-    
-    def _get_quarter(self, date):
-        """Determine quarter from date"""
-        month = date.month
-        year = date.year
+        keys = rows.keys
+        raw = {field: pd.Series(values, dtype=object) for field, values in rows.columns.items()}
+        for field in PROCESSED_FIELDS:
+            # Fields that were not requested only feed columns that are dropped below
+            raw.setdefault(field, pd.Series(None, index=range(len(keys)), dtype=object))
         
-        if month <= 3:
-            return f"Q1 {year}"
-        elif month <= 6:
-            return f"Q2 {year}"
-        elif month <= 9:
-            return f"Q3 {year}"
-        else:
-            return f"Q4 {year}"
-            
-    @st.cache_data(ttl=300)
-    def get_bugs(_self, project_key=PROJECT_KEY):
+        # Labels are normalized once per distinct label combination, then looked up
+        areas, area_masks = zip(*(area_summary(issue_labels or ()) for issue_labels in raw['labels']))
+        created = _parse_dates(raw['created'])
+        start_date = _parse_dates(raw['customfield_11317'])
+        issue_type = raw['issuetype']
+        description = raw['description'].fillna('').astype(str)
+        
+        quarter_date = start_date.fillna(created)
+        
+        df = pd.DataFrame({
+            'key': keys,
+            'summary': raw['summary'],
+            'status': raw['status'],
+            'priority': raw['priority'].fillna('Medium'),
+            'assignee': raw['assignee'].fillna('Unassigned'),
+            'reporter': raw['reporter'].fillna('Unknown'),
+            'issue_type': issue_type,
+            'areas': areas,
+            'area_mask': area_masks,
+            'created': created,
+            'updated': _parse_dates(raw['updated']),
+            'due_date': _parse_dates(raw['duedate']),
+            'start_date': start_date,
+            'quarter': 'Q' + quarter_date.dt.quarter.astype('Int64').astype(str) + ' '
+                       + quarter_date.dt.year.astype('Int64').astype(str),
+            'quarter_key': quarter_date.dt.year * 4 + quarter_date.dt.quarter - 1,
+            'is_bug': issue_type.str.lower().isin(['bug', 'defect', 'error']),
+            'story_points': raw['customfield_10016'],
+            'description': (description.str[:200] + '...').where(description != '', '')
+        })
+        
+        # Issues without the fields every dashboard relies on are skipped, as before
+        invalid = df[['summary', 'status', 'issue_type', 'created', 'updated']].isna().any(axis=1)
+        if invalid.any():
+            print(f"Error processing issues {', '.join(df.loc[invalid, 'key'])}: missing required fields")
+            df = df[~invalid].reset_index(drop=True)
+        
+        # Only keep the columns whose Jira fields were requested, in their compact dtypes
+        return apply_schema(df[ISSUE_COLUMNS])
+    
+    def get_bugs(self, project_key=PROJECT_KEY):
         """Fetch all bugs for a specific project using a direct JQL query."""
         try:
             jql = f'project = "{project_key}" AND issuetype = Bug'
-            search_data = _self._make_request('search', {'jql': jql, 'maxResults': 1000, 'fields': '*all'})
-            if search_data and 'issues' in search_data:
-                return _self._process_issues(search_data['issues'])
-            return pd.DataFrame()
+            return self._query(jql)
         except Exception as e:
             st.error(f"Error fetching bugs: {str(e)}")
             return pd.DataFrame()
 
-    @st.cache_data(ttl=300)
-    def get_incidents(_self, project_key=PROJECT_KEY):
+    def get_incidents(self, project_key=PROJECT_KEY):
         """Fetch all incidents for a specific project using a more flexible JQL query."""
         try:
             jql = f'project = "{project_key}" AND issuetype in (Incident, Incidente)'
-            search_data = _self._make_request('search', {'jql': jql, 'maxResults': 1000, 'fields': '*all'})
-            if search_data and 'issues' in search_data:
-                return _self._process_issues(search_data['issues'])
-            return pd.DataFrame()
+            return self._query(jql)
         except Exception as e:
             st.error(f"Error fetching incidents: {str(e)}")
             return pd.DataFrame()
     
-    @st.cache_data(ttl=300)
-    def get_project_statistics(_self, project_key=PROJECT_KEY):
+    def get_project_statistics(self, project_key=PROJECT_KEY):
         """Get project statistics and metrics for a specific project"""
         try:
-            df = _self.get_board_issues(project_key=project_key)
-            if df.empty:
-                return {}
-            
-            stats = {
-                'total_issues': len(df),
-                'bugs_count': len(df[df['is_bug'] == True]),
-                'open_issues': len(df[df['status'] != 'Done']),
-                'closed_issues': len(df[df['status'] == 'Done']),
-                'by_priority': df['priority'].value_counts().to_dict(),
-                'by_status': df['status'].value_counts().to_dict(),
-                'by_assignee': df['assignee'].value_counts().head(10).to_dict(),
-                'by_area': df['areas'].value_counts().to_dict(),
-                'by_quarter': df['quarter'].value_counts().to_dict()
-            }
-            
-            return stats
-            
+            df = self._query(f'project = "{project_key}"')
+            return self._project_statistics(project_key, df.attrs['data_version'], df)
         except Exception as e:
             st.error(f"Error getting statistics: {str(e)}")
             return {}
     
+    @st.cache_data(max_entries=32)
+    def _project_statistics(_self, project_key, data_version, _df):
+        """Compute project statistics once per dataset version from the frame read at that version"""
+        cube = _self._issue_cube(project_key, data_version, _df)
+        if not cube.count():
+            return {}
+        
+        # Assignees are not a cube dimension, so their top ten still come from the frame
+        closed_issues = cube.select(status='Done').count()
+        stats = {
+            'total_issues': cube.count(),
+            'bugs_count': cube.select(is_bug=True).count(),
+            'open_issues': cube.count() - closed_issues,
+            'closed_issues': closed_issues,
+            'story_points': cube.story_points(),
+            'by_priority': cube.counts('priority').to_dict(),
+            'by_status': cube.counts('status').to_dict(),
+            'by_assignee': _df['assignee'].value_counts().head(10).to_dict(),
+            'by_area': cube.counts('areas').to_dict(),
+            'by_quarter': cube.counts('quarter').to_dict()
+        }
+        
+        return stats
+    
+    def get_issue_cube(self, project_key=PROJECT_KEY):
+        """Get the aggregate issue cube of a project; dashboard metrics and charts read slices of it"""
+        try:
+            df = self._query(f'project = "{project_key}"')
+            return self._issue_cube(project_key, df.attrs['data_version'], df)
+        except Exception as e:
+            st.error(f"Error building issue cube: {str(e)}")
+            return build_cube(pd.DataFrame())
+    
+    @st.cache_data(max_entries=32)
+    def _issue_cube(_self, project_key, data_version, _df):
+        """Aggregate the project scan once per dataset version from the frame read at that version"""
+        return build_cube(_df)
+    
     def get_gantt_data(self, project_key=PROJECT_KEY, selected_areas=None):
         """Get data formatted for Gantt chart for a specific project"""
         try:
-            df = self.get_board_issues(project_key=project_key)
-            if df.empty:
-                return pd.DataFrame()
-            
-            # Filter by selected areas if provided
-            if selected_areas:
-                def check_area_match(areas_string):
-                    if areas_string == 'No Area':
-                        return 'No Area' in selected_areas
-                    else:
-                        issue_areas = [area.strip() for area in areas_string.split(',')]
-                        return any(selected_area in issue_areas for selected_area in selected_areas)
-                
-                area_mask = df['areas'].apply(check_area_match)
-                df = df[area_mask]
-            
-            # Prepare Gantt data
-            gantt_data = []
-            for _, row in df.iterrows():
-                start_date = row['start_date'] if row['start_date'] else row['created']
-                end_date = row['due_date'] if row['due_date'] else start_date + timedelta(days=14)
-                
-                summary_short = row['summary'][:50] + '...' if len(row['summary']) > 50 else row['summary']
-                
-                gantt_data.append({
-                    'Task': f"{row['key']} - {summary_short}",
-                    'Start': start_date,
-                    'Finish': end_date,
-                    'Resource': row['areas'] if row['areas'] != 'No Area' else 'General',
-                    'Status': row['status'],
-                    'Priority': row['priority'],
-                    'Assignee': row['assignee'],
-                    'Summary': row['summary'],
-                    'Key': row['key']
-                })
-            
-            return pd.DataFrame(gantt_data)
-            
+            df = self._query(f'project = "{project_key}"')
+            # Sorted so the same selection in any order hits the same cache entry
+            areas = tuple(sorted(selected_areas)) if selected_areas else ()
+            return self._gantt_data(project_key, df.attrs['data_version'], areas, df)
         except Exception as e:
             st.error(f"Error preparing Gantt data: {str(e)}")
             return pd.DataFrame()
+    
+    @st.cache_data(max_entries=16)
+    def _gantt_data(_self, project_key, data_version, selected_areas, _df):
+        """Build the Gantt rows once per dataset version and area selection from the frame read at that version"""
+        df = _df
+        
+        # Filter by selected areas if provided
+        if selected_areas:
+            df = df[area_filter(df['area_mask'], selected_areas)]
+        if df.empty:
+            return pd.DataFrame()
+        
+        # Tasks without dates start when created and get an estimated two weeks
+        start = df['start_date'].fillna(df['created'])
+        finish = df['due_date'].fillna(start + timedelta(days=14))
+        
+        # The Gantt view filters and counts these columns itself, so they are plain Python values
+        summary = df['summary'].astype(object)
+        summary_short = summary.where(summary.str.len() <= 50, summary.str[:50] + '...')
+        areas = df['areas'].astype(object)
+        
+        rows = pd.DataFrame({
+            'Task': df['key'].astype(object) + ' - ' + summary_short,
+            'Start': start,
+            'Finish': finish,
+            'Resource': areas.where(areas != 'No Area', 'General'),
+            'Status': df['status'].astype(object),
+            'Priority': df['priority'].astype(object),
+            'Assignee': df['assignee'].astype(object),
+            'Summary': summary,
+            'Key': df['key'].astype(object),
+            'AreaMask': df['area_mask']
+        }).reset_index(drop=True)
+        rows.attrs['data_version'] = data_version
+        return rows
@@ -0,0 +1,78 @@
+"""
+Aggregate issue cube: issue counts and story points per status, priority, area, quarter and type
+"""
+
+import numpy as np
+import pandas as pd
+from jira_api.areas import area_membership, area_filter
+
+# Dimensions of the cube; `areas` and `area_mask`, like `quarter` and `quarter_key`, describe the
+# same thing, so keeping both adds no cells
+CUBE_DIMENSIONS = ['status', 'priority', 'areas', 'area_mask', 'quarter', 'quarter_key', 'issue_type', 'is_bug']
+CUBE_MEASURES = ['count', 'story_points']
+
+
+class IssueCube:
+    def __init__(self, cells, attrs=None):
+        """Wrap cube cells: one row per observed combination of CUBE_DIMENSIONS with its measures"""
+        self.cells = cells
+        # Like DataFrame.attrs, carries the data version of the frame the cube was built from
+        self.attrs = attrs or {}
+
+    def _mask(self, area, filters):
+        """Boolean mask of the cells matching an area and dimension filters"""
+        cells = self.cells
+        mask = np.ones(len(cells), dtype=bool)
+        if area is not None:
+            mask &= area_filter(cells['area_mask'], [area]).to_numpy()
+
+        for dimension, values in filters.items():
+            if isinstance(values, (str, bool)) or not hasattr(values, '__iter__'):
+                values = [values]
+            column = cells[dimension]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Jira names compare case-insensitively, as in the JQL the dashboards used to run
+                wanted = {str(value).lower() for value in values}
+                values = [category for category in column.cat.categories if str(category).lower() in wanted]
+            mask &= column.isin(values).to_numpy()
+        return mask
+
+    def select(self, area=None, **filters):
+        """Sub-cube of the issues in `area` whose dimensions take one of the given values"""
+        return IssueCube(self.cells[self._mask(area, filters)], self.attrs)
+
+    def exclude(self, area=None, **filters):
+        """Sub-cube of the issues that `select` with the same arguments would leave out"""
+        return IssueCube(self.cells[~self._mask(area, filters)], self.attrs)
+
+    def count(self):
+        """Number of issues in the cube"""
+        return int(self.cells['count'].sum())
+
+    def story_points(self):
+        """Story points of the issues in the cube"""
+        return float(self.cells['story_points'].sum())
+
+    def counts(self, *dimensions, measure='count'):
+        """Measure per combination of the given dimensions; a single dimension is sorted like value_counts"""
+        totals = self.cells.groupby(list(dimensions), observed=True)[measure].sum()
+        if len(dimensions) == 1:
+            totals = totals.sort_values(ascending=False)
+        return totals
+
+    def area_counts(self, measure='count'):
+        """Measure per area, counting an issue once in every area it belongs to, with 'No Area' last"""
+        membership = area_membership(self.cells['area_mask'])
+        return membership.mul(self.cells[measure], axis=0).sum().astype(self.cells[measure].dtype)
+
+
+def build_cube(frame):
+    """Aggregate an issue frame into an IssueCube"""
+    if frame.empty:
+        return IssueCube(pd.DataFrame(columns=CUBE_DIMENSIONS + CUBE_MEASURES), frame.attrs)
+
+    cells = frame.groupby(CUBE_DIMENSIONS, observed=True, dropna=False, sort=False).agg(
+        count=('key', 'size'),
+        story_points=('story_points', 'sum')
+    )
+    return IssueCube(cells.reset_index(), frame.attrs)
@@ -0,0 +1,128 @@
+"""
+Field projection registry mapping issue DataFrame columns to the Jira fields they need
+"""
+
+import numpy as np
+from config.settings import AREAS
+
+# DataFrame column -> Jira fields needed to build it (the issue key is always returned)
+COLUMN_FIELDS = {
+    'key': [],
+    'summary': ['summary'],
+    'status': ['status'],
+    'priority': ['priority'],
+    'assignee': ['assignee'],
+    'reporter': ['reporter'],
+    'issue_type': ['issuetype'],
+    'areas': ['labels'],
+    'area_mask': ['labels'],
+    'created': ['created'],
+    'updated': ['updated'],
+    'due_date': ['duedate'],
+    'start_date': ['customfield_11317'],
+    'quarter': ['customfield_11317', 'created'],
+    'quarter_key': ['customfield_11317', 'created'],
+    'is_bug': ['issuetype'],
+    'story_points': ['customfield_10016'],
+    'description': ['description']
+}
+
+# Columns every issue frame carries because the client itself relies on them
+REQUIRED_COLUMNS = ['key', 'summary', 'status', 'issue_type', 'area_mask', 'created', 'updated']
+
+# Columns each dashboard reads from the issue frame
+DASHBOARD_COLUMNS = {
+    'overview': ['key', 'summary', 'status', 'priority', 'assignee', 'areas', 'updated', 'is_bug'],
+    'statistics': ['status', 'priority', 'assignee', 'areas', 'quarter', 'quarter_key', 'issue_type', 'is_bug',
+                   'story_points'],
+    'bugs': ['key', 'summary', 'status', 'priority', 'assignee', 'areas', 'issue_type', 'created'],
+    'incidents': ['key', 'summary', 'status', 'priority', 'assignee', 'areas', 'issue_type', 'created'],
+    'priorities': ['key', 'summary', 'status', 'priority', 'assignee', 'areas', 'issue_type', 'created'],
+    'quarters': ['key', 'summary', 'status', 'priority', 'assignee', 'areas', 'quarter', 'quarter_key',
+                 'start_date', 'due_date', 'created'],
+    'gantt': ['key', 'summary', 'status', 'priority', 'assignee', 'areas', 'created',
+              'start_date', 'due_date']
+}
+
+# Bit i of `area_mask` is set when an issue belongs to AREAS[i]; 0 means 'No Area'
+AREA_BITS = {area: 1 << index for index, area in enumerate(AREAS)}
+AREA_MASK_DTYPE = np.min_scalar_type(2 ** len(AREAS) - 1).name
+
+# Compact dtypes of the issue frame; Arrow strings avoid a Python object per free-text cell
+COLUMN_DTYPES = {
+    'key': 'string[pyarrow]',
+    'summary': 'string[pyarrow]',
+    'status': 'category',
+    'priority': 'category',
+    'assignee': 'category',
+    'reporter': 'category',
+    'issue_type': 'category',
+    'areas': 'category',
+    'area_mask': AREA_MASK_DTYPE,
+    'created': 'datetime64[ns]',
+    'updated': 'datetime64[ns]',
+    'due_date': 'datetime64[ns]',
+    'start_date': 'datetime64[ns]',
+    'quarter': 'category',
+    'quarter_key': 'int16',
+    'is_bug': 'bool',
+    'story_points': 'float64',
+    'description': 'string[pyarrow]'
+}
+
+
+def columns_for(dashboards=None):
+    """Return the issue frame columns needed by the given dashboards (all dashboards by default)"""
+    if dashboards is None:
+        dashboards = DASHBOARD_COLUMNS.keys()
+
+    wanted = set(REQUIRED_COLUMNS)
+    for dashboard in dashboards:
+        wanted.update(DASHBOARD_COLUMNS[dashboard])
+
+    # Keep the registry order so frames always have the same column layout
+    return [column for column in COLUMN_FIELDS if column in wanted]
+
+
+def fields_for(columns):
+    """Return the comma-separated Jira fields needed to build the given columns"""
+    fields = []
+    for column in columns:
+        for field in COLUMN_FIELDS[column]:
+            if field not in fields:
+                fields.append(field)
+    return ','.join(fields)
+
+
+def quarter_label(key):
+    """Quarter label such as 'Q3 2025' for a quarter key (year * 4 + quarter - 1); key - 1 is the previous quarter"""
+    return f"Q{key % 4 + 1} {key // 4}"
+
+
+def apply_schema(frame):
+    """Cast an issue frame to COLUMN_DTYPES, dropping categories that no issue uses any more"""
+    dtypes = {column: dtype for column, dtype in COLUMN_DTYPES.items() if column in frame.columns}
+    frame = frame.astype(dtypes)
+    for column, dtype in dtypes.items():
+        if dtype == 'category':
+            frame[column] = frame[column].cat.remove_unused_categories()
+
+    if 'quarter' in frame.columns and 'quarter_key' in frame.columns:
+        # Labels are ordered by the integer key computed at ingestion, so nothing parses them
+        keys = frame.groupby('quarter', observed=True)['quarter_key'].first().sort_values()
+        frame['quarter'] = frame['quarter'].cat.set_categories(keys.index, ordered=True)
+    return frame
+
+
+def memory_report(frame, label='issue frame'):
+    """Print and return the bytes used by each column of a frame, largest first"""
+    usage = frame.memory_usage(index=False, deep=True).sort_values(ascending=False)
+    print(f"DEBUG: {label} uses {usage.sum() / 1024:.1f} KiB for {len(frame)} rows")
+    for column, size in usage.items():
+        print(f"DEBUG:   {column:<12} {str(frame[column].dtype):<16} {size / 1024:>10.1f} KiB")
+    return usage
+
+
+# Columns and search fields for the dashboards rendered by the app
+ISSUE_COLUMNS = columns_for()
+ISSUE_FIELDS = fields_for(ISSUE_COLUMNS)
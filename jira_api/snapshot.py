@@ -0,0 +1,84 @@
+"""
+Arrow IPC snapshots of processed issue frames, loaded through a memory map on cold start
+"""
+
+import hashlib
+import os
+import re
+from datetime import datetime
+import pandas as pd
+import pyarrow as pa
+from config.settings import ISSUE_SNAPSHOT_DIR
+from jira_api.fields import ISSUE_COLUMNS, apply_schema
+
+# Bumped whenever the snapshot layout changes; snapshots of another format are ignored
+SNAPSHOT_FORMAT = '1'
+
+
+def _arrow_strings(arrow_type):
+    """Keep Arrow string columns as pandas Arrow strings, which reuse the mapped buffers"""
+    if arrow_type in (pa.string(), pa.large_string()):
+        return pd.StringDtype('pyarrow')
+    return None
+
+
+class IssueSnapshots:
+    def __init__(self, directory=ISSUE_SNAPSHOT_DIR):
+        """Keep snapshots in the given directory, creating it if needed"""
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, project_key, visibility):
+        """Snapshot file of a project as seen with one visibility fingerprint"""
+        project = re.sub(r'[^A-Za-z0-9_-]', '_', project_key)
+        visibility_hash = hashlib.sha256(visibility.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, f'{project}-{visibility_hash}.arrow')
+
+    def write(self, project_key, visibility, frame, watermark, last_sweep):
+        """Write a frame and its sync watermarks, replacing the previous snapshot atomically"""
+        table = pa.Table.from_pandas(frame[ISSUE_COLUMNS], preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            b'snapshot_format': SNAPSHOT_FORMAT.encode(),
+            b'columns': ','.join(ISSUE_COLUMNS).encode(),
+            b'watermark': watermark.isoformat().encode(),
+            b'last_sweep': last_sweep.isoformat().encode()
+        })
+
+        # Readers in other processes keep mapping the old file until they reload
+        path = self.path(project_key, visibility)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        try:
+            # Uncompressed so the columns can be used straight from the memory map
+            with pa.OSFile(temporary, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def delete(self, project_key, visibility):
+        """Remove the snapshot of a project as seen with one visibility fingerprint, if there is one"""
+        path = self.path(project_key, visibility)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def load(self, project_key, visibility):
+        """Return (frame, watermark, last_sweep) from a snapshot, or None if there is no usable one"""
+        path = self.path(project_key, visibility)
+        if not os.path.exists(path):
+            return None
+
+        # Pages of the mapped file are shared by every process on the host that loads it
+        source = pa.memory_map(path, 'r')
+        table = pa.ipc.open_file(source).read_all()
+        metadata = table.schema.metadata or {}
+        if (metadata.get(b'snapshot_format') != SNAPSHOT_FORMAT.encode()
+                or metadata.get(b'columns') != ','.join(ISSUE_COLUMNS).encode()):
+            print(f"DEBUG: Ignoring snapshot {path} written with another column layout")
+            return None
+
+        frame = apply_schema(table.to_pandas(types_mapper=_arrow_strings))
+        watermark = datetime.fromisoformat(metadata[b'watermark'].decode())
+        last_sweep = datetime.fromisoformat(metadata[b'last_sweep'].decode())
+        return frame, watermark, last_sweep
@@ -0,0 +1,135 @@
+"""
+Persistent SQLite store for processed issues, keyed by project, visibility and issue key
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+import pandas as pd
+from config.settings import ISSUE_STORE_PATH
+from jira_api.fields import ISSUE_COLUMNS, apply_schema
+
+
+DATETIME_COLUMNS = ['created', 'updated', 'due_date', 'start_date']
+
+
+class IssueStore:
+    def __init__(self, path=ISSUE_STORE_PATH):
+        """Open (and create if needed) the store at the given path"""
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+
+            # The store is only a cache, so rows written with another column layout are dropped
+            stored_columns = [row[1] for row in conn.execute('PRAGMA table_info(issues)')]
+            if stored_columns and stored_columns != ['project_key', 'visibility', *ISSUE_COLUMNS]:
+                conn.execute('DROP TABLE issues')
+                conn.execute('DROP TABLE IF EXISTS sync_state')
+
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS sync_state (project_key TEXT NOT NULL, visibility TEXT NOT NULL, '
+                'watermark TEXT NOT NULL, last_sweep TEXT NOT NULL, PRIMARY KEY (project_key, visibility))'
+            )
+            columns = ', '.join(f'"{column}"' for column in ISSUE_COLUMNS)
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS issues ('
+                f'project_key TEXT NOT NULL, visibility TEXT NOT NULL, {columns}, '
+                f'PRIMARY KEY (project_key, visibility, key))'
+            )
+
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection; one per call keeps the store safe across threads"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def state(self, project_key, visibility):
+        """Return the stored (watermark, last_sweep) of a project, or None if it was never synced"""
+        with self._connect() as conn:
+            state = conn.execute(
+                'SELECT watermark, last_sweep FROM sync_state WHERE project_key = ? AND visibility = ?',
+                (project_key, visibility)
+            ).fetchone()
+        if state is None:
+            return None
+        return datetime.fromisoformat(state[0]), datetime.fromisoformat(state[1])
+
+    def load(self, project_key, visibility):
+        """Return (frame, watermark, last_sweep) for a project, or None if nothing usable is stored"""
+        state = self.state(project_key, visibility)
+        if state is None:
+            return None
+
+        with self._connect() as conn:
+            columns = ', '.join(f'"{column}"' for column in ISSUE_COLUMNS)
+            frame = pd.read_sql_query(
+                f'SELECT {columns} FROM issues WHERE project_key = ? AND visibility = ?',
+                conn, params=(project_key, visibility)
+            )
+
+        return apply_schema(frame), *state
+
+    def replace(self, project_key, visibility, frame, watermark, last_sweep):
+        """Store a full project scan, discarding whatever was stored before"""
+        with self._connect() as conn:
+            conn.execute(
+                'DELETE FROM issues WHERE project_key = ? AND visibility = ?', (project_key, visibility)
+            )
+            self._write_rows(conn, project_key, visibility, frame)
+            self._write_state(conn, project_key, visibility, watermark, last_sweep)
+
+    def upsert(self, project_key, visibility, changed, watermark, last_sweep, keep_keys=None):
+        """Store changed rows and, after a key sweep, drop every issue not in `keep_keys`"""
+        with self._connect() as conn:
+            self._write_rows(conn, project_key, visibility, changed)
+            if keep_keys is not None:
+                conn.execute('CREATE TEMP TABLE IF NOT EXISTS keep_keys (key TEXT PRIMARY KEY)')
+                conn.execute('DELETE FROM keep_keys')
+                conn.executemany('INSERT OR IGNORE INTO keep_keys VALUES (?)', [(key,) for key in keep_keys])
+                conn.execute(
+                    'DELETE FROM issues WHERE project_key = ? AND visibility = ? '
+                    'AND key NOT IN (SELECT key FROM keep_keys)',
+                    (project_key, visibility)
+                )
+            self._write_state(conn, project_key, visibility, watermark, last_sweep)
+
+    def delete(self, project_key, visibility):
+        """Forget everything stored for a project as seen with one visibility fingerprint"""
+        with self._connect() as conn:
+            conn.execute(
+                'DELETE FROM issues WHERE project_key = ? AND visibility = ?', (project_key, visibility)
+            )
+            conn.execute(
+                'DELETE FROM sync_state WHERE project_key = ? AND visibility = ?', (project_key, visibility)
+            )
+
+    def _write_rows(self, conn, project_key, visibility, frame):
+        """Insert or replace rows of a processed issue frame"""
+        if frame.empty:
+            return
+
+        rows = frame[ISSUE_COLUMNS].copy()
+        for column in DATETIME_COLUMNS:
+            if column in rows.columns:
+                rows[column] = pd.to_datetime(rows[column]).dt.strftime('%Y-%m-%dT%H:%M:%S')
+        rows = rows.astype(object).where(rows.notna(), None)
+
+        columns = ', '.join(f'"{column}"' for column in ISSUE_COLUMNS)
+        placeholders = ', '.join('?' for _ in range(len(ISSUE_COLUMNS) + 2))
+        conn.executemany(
+            f'INSERT OR REPLACE INTO issues (project_key, visibility, {columns}) VALUES ({placeholders})',
+            [(project_key, visibility, *row) for row in rows.itertuples(index=False, name=None)]
+        )
+
+    def _write_state(self, conn, project_key, visibility, watermark, last_sweep):
+        """Record the sync watermark of a project"""
+        conn.execute(
+            'INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)',
+            (project_key, visibility, watermark.isoformat(), last_sweep.isoformat())
+        )
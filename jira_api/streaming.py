@@ -0,0 +1,110 @@
+"""
+Incremental parsing of Jira search responses, handing over one issue at a time
+"""
+
+import codecs
+import json
+import re
+
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+VALUE_TERMINATORS = ' \t\n\r,:]}'
+
+_decoder = json.JSONDecoder()
+_INCOMPLETE = object()
+
+
+class SearchResponseParser:
+    def __init__(self, on_issue, array_key='issues'):
+        """Parse a search response fed in chunks, passing each issue to `on_issue` once it is complete"""
+        self.on_issue = on_issue
+        self.array_key = array_key
+        self.metadata = {}
+        self.state = 'start'
+        self.key = None
+        self.text = ''
+        self.pos = 0
+        self.utf8 = codecs.getincrementaldecoder('utf-8')()
+
+    def feed(self, chunk, final=False):
+        """Parse as much of the response as the bytes received so far allow"""
+        # Only the unparsed tail is kept, so memory is bounded by the largest single issue
+        self.text = self.text[self.pos:] + self.utf8.decode(chunk, final)
+        self.pos = 0
+        while self._step():
+            pass
+
+    def close(self):
+        """Finish parsing and return the top-level fields other than the issue array"""
+        self.feed(b'', final=True)
+        if self.state != 'done':
+            raise ValueError('Truncated or malformed Jira search response')
+        return self.metadata
+
+    def _step(self):
+        """Consume one token of the top-level object; return False when more input is needed"""
+        pos = WHITESPACE.match(self.text, self.pos).end()
+        if pos >= len(self.text) or self.state == 'done':
+            return False
+        char = self.text[pos]
+
+        if self.state == 'start':
+            if char != '{':
+                raise ValueError('Jira search response is not a JSON object')
+            self.state = 'key'
+        elif self.state in ('key', 'items') and char == ',':
+            pass
+        elif self.state == 'key' and char == '}':
+            self.state = 'done'
+        elif self.state == 'items' and char == ']':
+            self.state = 'key'
+        elif self.state == 'colon':
+            if char != ':':
+                raise ValueError('Malformed Jira search response')
+            self.state = 'value'
+        elif self.state == 'value' and self.key == self.array_key and char == '[':
+            self.state = 'items'
+        else:
+            value = self._decode(pos)
+            if value is _INCOMPLETE:
+                return False
+            if self.state == 'key':
+                self.key = value
+                self.state = 'colon'
+            elif self.state == 'value':
+                self.metadata[self.key] = value
+                self.state = 'key'
+            else:
+                self.on_issue(value)
+            return True
+
+        self.pos = pos + 1
+        return True
+
+    def _decode(self, pos):
+        """Decode the JSON value at `pos`, or return _INCOMPLETE if it may continue in the next chunk"""
+        try:
+            value, end = _decoder.raw_decode(self.text, pos)
+        except json.JSONDecodeError:
+            return _INCOMPLETE
+        # A number cut by the chunk boundary still decodes, so the next character must end the value
+        if end >= len(self.text) or self.text[end] not in VALUE_TERMINATORS:
+            return _INCOMPLETE
+        self.pos = end
+        return value
+
+
+def parse_search_response(chunks, on_issue):
+    """Stream a search response body through the parser and return its top-level metadata"""
+    parser = SearchResponseParser(on_issue)
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+async def parse_search_response_async(chunks, on_issue):
+    """Like parse_search_response, for an async iterator of body chunks"""
+    parser = SearchResponseParser(on_issue)
+    async for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
@@ -0,0 +1,264 @@
+"""
+Incremental issue sync that refreshes a project from an `updated >=` watermark
+"""
+
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import pandas as pd
+from config.settings import SYNC_OVERLAP_MINUTES, SYNC_SWEEP_SECONDS, SYNC_REFRESH_SECONDS, ISSUE_MEMORY_REPORT
+from jira_api.fields import ISSUE_FIELDS, apply_schema, memory_report
+from jira_api.snapshot import IssueSnapshots
+from jira_api.store import IssueStore
+
+
+class ProjectSync:
+    def __init__(self, project_key, visibility):
+        """Track the synced issue frame of one project as seen with one visibility fingerprint"""
+        self.project_key = project_key
+        self.visibility = visibility
+        self.frame = None
+        self.version = 0
+        self.synced_at = None
+        self.refreshing = False
+        self.watermark = None
+        self.last_sweep = None
+        self.retired = False
+        # `lock` serializes syncs; `state_lock` only guards the swap, so readers never wait on Jira
+        self.lock = threading.Lock()
+        self.state_lock = threading.Lock()
+
+    def get(self, client):
+        """Return the latest frame and its version, refreshing it on a worker thread once it is older than the TTL"""
+        # Read together, so a swap landing between two reads never pairs a frame with another version
+        with self.state_lock:
+            frame, version = self.frame, self.version
+            if frame is not None and self.is_stale() and not self.refreshing:
+                self.refreshing = True
+                _refresh_executor.submit(self._refresh_in_background, client)
+
+        if frame is not None:
+            return frame, version
+
+        # Nothing in memory yet: serve the on-disk copy if there is one, otherwise sync now
+        with self.lock:
+            if self.frame is None:
+                self._load_from_store()
+        if self.frame is None:
+            self.refresh(client)
+        return self.get(client)
+
+    def is_stale(self):
+        """Whether the frame is older than the refresh interval or was restored from disk"""
+        if self.synced_at is None:
+            return True
+        return (datetime.now(timezone.utc) - self.synced_at).total_seconds() >= SYNC_REFRESH_SECONDS
+
+    def refresh(self, client):
+        """Bring the frame up to date, downloading the whole project only on the first sync"""
+        with self.lock:
+            started = datetime.now(timezone.utc)
+            project_jql = f'project = "{self.project_key}"'
+            # A pruned sync still serves the session holding it, but writing would bring its stored copies back
+            store = _get_store() if not self.retired else None
+
+            if self.frame is None:
+                frame = client._process_issues(client._search_issues(project_jql))
+                if ISSUE_MEMORY_REPORT:
+                    memory_report(frame, f'{self.project_key} issue frame')
+                self._swap(frame, started, started)
+                if store is not None:
+                    _write_store(store.replace, self.project_key, self.visibility, frame, started, started)
+                self._write_snapshot(frame, started, started)
+                return frame
+
+            # Deleted issues never show up as updated, so reconcile keys now and then; ordering
+            # by key keeps offsets stable while issues are created during the sweep
+            queries = [(self._changed_jql(started), ISSUE_FIELDS)]
+            sweep_due = (started - self.last_sweep).total_seconds() >= SYNC_SWEEP_SECONDS
+            if sweep_due:
+                queries.append((f'{project_jql} ORDER BY key', 'key'))
+            results = client._search_many(queries)
+
+            changed = client._process_issues(results[0])
+            frame = _upsert(self.frame, changed)
+
+            keys = None
+            last_sweep = self.last_sweep
+            if sweep_due and results[1].complete():
+                # Issues created after the sweep paged past them only show up in `changed`
+                keys = set(results[1].keys) | set(changed['key'])
+                frame = frame[frame['key'].isin(keys)].reset_index(drop=True)
+                last_sweep = started
+            elif sweep_due:
+                # A deletion while paging shifts later pages, so a short sweep cannot tell
+                # deleted issues from skipped ones; nothing is dropped and it runs again next sync
+                print(f"DEBUG: Key sweep of {self.project_key} came back incomplete, retrying on the next sync")
+
+            # The watermark is our own clock at the start of the sync, so nothing updated mid-fetch is missed
+            self._swap(frame, started, last_sweep)
+            if store is not None:
+                _write_store(store.upsert, self.project_key, self.visibility, changed, started, last_sweep, keys)
+            self._write_snapshot(frame, started, last_sweep)
+            return frame
+
+    def retire(self):
+        """Delete the stored copies of a fingerprint no user resolves to any more"""
+        # Taking the sync lock waits out a running refresh, which would otherwise write them again
+        with self.lock:
+            self.retired = True
+            # Held while deleting, so a user resolving to this fingerprint again starts from a clean slate
+            with _project_syncs_lock:
+                if (self.project_key, self.visibility) in _project_syncs:
+                    return
+                store = _get_store()
+                if store is not None:
+                    _write_store(store.delete, self.project_key, self.visibility)
+                snapshots = _get_snapshots()
+                if snapshots is not None:
+                    _write_store(snapshots.delete, self.project_key, self.visibility)
+
+    def _refresh_in_background(self, client):
+        """Refresh on a worker thread, keeping the last good frame if Jira fails"""
+        try:
+            self.refresh(client)
+        except Exception as e:
+            print(f"DEBUG: Background refresh of {self.project_key} failed: {e}")
+        finally:
+            with self.state_lock:
+                self.refreshing = False
+
+    def _swap(self, frame, watermark, last_sweep, synced=True):
+        """Publish a new frame atomically"""
+        with self.state_lock:
+            self.frame = frame
+            self.version += 1
+            self.synced_at = watermark if synced else None
+            self.watermark = watermark
+            self.last_sweep = last_sweep
+
+    def _write_snapshot(self, frame, watermark, last_sweep):
+        """Snapshot the whole frame so cold starts can map it instead of reading the store"""
+        snapshots = _get_snapshots()
+        if snapshots is not None and not self.retired:
+            _write_store(snapshots.write, self.project_key, self.visibility, frame, watermark, last_sweep)
+
+    def _load_from_store(self):
+        """Restore the frame and watermarks saved by a previous process, preferring the snapshot"""
+        stored = None
+        snapshots = _get_snapshots()
+        if snapshots is not None:
+            try:
+                stored = snapshots.load(self.project_key, self.visibility)
+            except Exception as e:
+                print(f"DEBUG: Failed to load the {self.project_key} snapshot: {e}")
+
+        store = _get_store()
+        if store is not None:
+            try:
+                # Snapshots are written after the store, so one is only behind it if that write failed
+                state = store.state(self.project_key, self.visibility)
+                if state is not None and (stored is None or state[0] > stored[1]):
+                    stored = store.load(self.project_key, self.visibility)
+            except Exception as e:
+                print(f"DEBUG: Failed to load {self.project_key} from the issue store: {e}")
+
+        if stored is not None:
+            # Served straight away and refreshed behind it, like any stale frame
+            frame, watermark, last_sweep = stored
+            self._swap(frame, watermark, last_sweep, synced=False)
+
+    def _changed_jql(self, now):
+        """JQL for issues updated since the watermark"""
+        # A relative offset avoids absolute JQL dates, which Jira reads in the user's own timezone
+        minutes = math.ceil((now - self.watermark).total_seconds() / 60) + SYNC_OVERLAP_MINUTES
+        return f'project = "{self.project_key}" AND updated >= -{minutes}m'
+
+
+def _upsert(frame, changed):
+    """Replace rows of `frame` by key with the rows in `changed`, appending new keys"""
+    if changed.empty:
+        return frame
+    if frame.empty:
+        return changed
+
+    kept = frame[~frame['key'].isin(changed['key'])]
+    # Concatenating categoricals with different categories falls back to object, so cast again
+    return apply_schema(pd.concat([kept, changed], ignore_index=True))
+
+
+# Background refreshes run here, so once a project is loaded no rerun waits for Jira
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='jira-refresh')
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def _get_store():
+    """Return the shared issue store, or None if it cannot be opened"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = IssueStore()
+            except Exception as e:
+                print(f"DEBUG: Issue store unavailable: {e}")
+                return None
+        return _store
+
+
+_snapshots = None
+
+
+def _get_snapshots():
+    """Return the shared snapshot directory, or None if it cannot be created"""
+    global _snapshots
+    with _store_lock:
+        if _snapshots is None:
+            try:
+                _snapshots = IssueSnapshots()
+            except Exception as e:
+                print(f"DEBUG: Issue snapshots unavailable: {e}")
+                return None
+        return _snapshots
+
+
+def _write_store(write, *args):
+    """Persist a sync result; the store and snapshots are only caches, so failures never fail the sync"""
+    try:
+        write(*args)
+    except Exception as e:
+        print(f"DEBUG: {write.__qualname__} failed: {e}")
+
+
+# Sync state lives at module level so it survives reruns and cache clears
+_project_syncs = {}
+# Fingerprint each user last resolved to per project, so superseded ones can be pruned
+_user_visibility = {}
+_project_syncs_lock = threading.Lock()
+
+
+def get_project_sync(project_key, visibility, user):
+    """Return the sync state for a project and visibility fingerprint, creating it on first use"""
+    with _project_syncs_lock:
+        previous = _user_visibility.get((project_key, user))
+        _user_visibility[(project_key, user)] = visibility
+        if previous is not None and previous != visibility:
+            _prune(project_key, previous)
+
+        if (project_key, visibility) not in _project_syncs:
+            _project_syncs[(project_key, visibility)] = ProjectSync(project_key, visibility)
+        return _project_syncs[(project_key, visibility)]
+
+
+def _prune(project_key, visibility):
+    """Drop a fingerprint's frame and stored copies once no user resolves to it; callers hold the syncs lock"""
+    if any(key[0] == project_key and seen == visibility for key, seen in _user_visibility.items()):
+        return
+
+    sync = _project_syncs.pop((project_key, visibility), None)
+    if sync is None:
+        sync = ProjectSync(project_key, visibility)
+    # Deleting waits for a running refresh, so it never blocks the rerun that noticed the change
+    _refresh_executor.submit(sync.retire)
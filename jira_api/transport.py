@@ -0,0 +1,211 @@
+"""
+Pooled keep-alive HTTP transport shared by every Jira client using the same credentials
+"""
+
+import asyncio
+import base64
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
+from config.settings import (
+    JIRA_SERVER, HTTP_POOL_MAXSIZE, HTTP_TIMEOUT, HTTP_STREAM_CHUNK_SIZE, HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX, JIRA_REQUESTS_PER_SECOND, JIRA_REQUEST_BURST
+)
+from jira_api.streaming import parse_search_response
+
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Errors worth retrying: connections dropped or timed out while sending or while reading the body
+RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError
+)
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        """Allow `rate` requests per second on average, with bursts of up to `capacity`"""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token if one is available, otherwise return how many seconds to wait first"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        wait = self.reserve()
+        while wait > 0:
+            time.sleep(wait)
+            wait = self.reserve()
+
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        wait = self.reserve()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self.reserve()
+
+    def pause(self, seconds):
+        """Hold back every caller for a while, e.g. after Jira reports the rate limit was hit"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+# One budget for the whole process so concurrent sessions cannot stampede Jira together
+_request_budget = TokenBucket(JIRA_REQUESTS_PER_SECOND, JIRA_REQUEST_BURST)
+
+
+def _backoff_delay(attempt):
+    """Exponential backoff with jitter for the given retry attempt"""
+    delay = min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _seconds_until(value):
+    """Parse a header holding delta-seconds, epoch seconds, an ISO timestamp or an HTTP date"""
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+        # Large numbers are epoch timestamps rather than a delay
+        return seconds - time.time() if seconds > 10 ** 9 else seconds
+    except ValueError:
+        pass
+
+    try:
+        moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - datetime.now(timezone.utc)).total_seconds()
+
+
+def _rate_limit_delay(response):
+    """Seconds Jira asks us to wait before the next request, if it said so"""
+    delay = _seconds_until(response.headers.get('Retry-After'))
+    if delay is None and response.headers.get('X-RateLimit-Remaining') == '0':
+        delay = _seconds_until(response.headers.get('X-RateLimit-Reset'))
+    if delay is None:
+        return None
+    return min(max(delay, 0), HTTP_BACKOFF_MAX)
+
+
+class JiraTransport:
+    def __init__(self, email, api_key):
+        """Open a pooled session authenticated with the given credentials"""
+        auth_str = f'{email}:{api_key}'
+        auth_b64 = base64.b64encode(auth_str.encode('ascii')).decode('ascii')
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'Basic {auth_b64}',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Content-Type': 'application/json'
+        })
+
+        # Jira is a single host, so one pool sized for the parallel search workers of several sessions
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, endpoint, params=None, on_issue=None):
+        """GET a Jira REST endpoint and return the decoded JSON body, retrying transient failures"""
+        url = f'{JIRA_SERVER}/rest/api/2/{endpoint}'
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            _request_budget.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=HTTP_TIMEOUT, stream=on_issue is not None)
+            except RETRYABLE_ERRORS:
+                if attempt == HTTP_MAX_RETRIES:
+                    raise
+                time.sleep(_backoff_delay(attempt))
+                continue
+
+            with response:
+                delay = _rate_limit_delay(response)
+                if delay:
+                    # Jira throttles per account and per instance, so every caller backs off
+                    _request_budget.pause(delay)
+
+                if response.status_code in RETRYABLE_STATUS_CODES and attempt < HTTP_MAX_RETRIES:
+                    time.sleep(delay or _backoff_delay(attempt))
+                    continue
+
+                response.raise_for_status()
+                if on_issue is None:
+                    return response.json()
+
+                # Search pages are streamed and only the other top-level fields are returned; issues
+                # are held until the page parses, so a page retried after a dropped body is never added twice
+                page = []
+                try:
+                    metadata = parse_search_response(response.iter_content(HTTP_STREAM_CHUNK_SIZE), page.append)
+                except RETRYABLE_ERRORS:
+                    if attempt == HTTP_MAX_RETRIES:
+                        raise
+                    time.sleep(_backoff_delay(attempt))
+                    continue
+
+            for issue in page:
+                on_issue(issue)
+            return metadata
+
+    def close(self):
+        """Close every pooled connection"""
+        self.session.close()
+
+
+# Transports live at module level so they outlive reruns and are shared between sessions
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def _credential_key(email, api_key):
+    """Hash credentials so the registry never holds them in plain text"""
+    return hashlib.sha256(f'{email}:{api_key}'.encode('utf-8')).hexdigest()
+
+
+def get_transport(email, api_key):
+    """Return the shared transport for a credential, creating it on first use"""
+    key = _credential_key(email, api_key)
+    with _transports_lock:
+        if key not in _transports:
+            _transports[key] = JiraTransport(email, api_key)
+        return _transports[key]
+
+
+def close_transport(email, api_key):
+    """Close and forget the shared transport for a credential, if one is open"""
+    with _transports_lock:
+        transport = _transports.pop(_credential_key(email, api_key), None)
+    if transport is not None:
+        transport.close()
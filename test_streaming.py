@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for the streaming Jira search response parser
+"""
+
+import json
+import random
+import pytest
+import requests
+from jira_api import transport
+from jira_api.streaming import SearchResponseParser, parse_search_response
+
+
+def random_issue(rnd, index):
+    """Build an issue with nested objects, escapes, unicode and numbers that chunking can split"""
+    return {
+        'id': str(10000 + index),
+        'key': f'AICP-{index}',
+        'fields': {
+            'summary': rnd.choice(['Plain summary', 'Aspas "duplas" e \\ barra', 'Migração de dados ✓ 🚀', '']),
+            'status': {'name': rnd.choice(['To Do', 'Done']), 'statusCategory': {'id': rnd.randint(1, 4)}},
+            'priority': rnd.choice([None, {'name': 'High', 'iconUrl': 'https://jira/icons/high.svg'}]),
+            'labels': rnd.sample(['DevOps', 'dados', 'Quality', 'architecture'], rnd.randint(0, 3)),
+            'customfield_10016': rnd.choice([None, 3, 5.5, -1e-3, 123456789, True, False]),
+            'description': rnd.choice([None, 'linha 1\nlinha 2\té', 'x' * rnd.randint(0, 500)])
+        }
+    }
+
+
+def random_response(rnd):
+    """Serialize a search response with metadata on both sides of the issues array"""
+    response = {
+        'expand': 'schema,names',
+        'startAt': rnd.randint(0, 1000),
+        'maxResults': 100,
+        'total': rnd.randint(0, 100000),
+        'issues': [random_issue(rnd, index) for index in range(rnd.randint(0, 30))],
+        'warningMessages': rnd.choice([[], ['Campo "x" não existe']])
+    }
+    indent = rnd.choice([None, 2])
+    separators = rnd.choice([(',', ':'), (', ', ': ')])
+    return json.dumps(response, indent=indent, separators=separators, ensure_ascii=rnd.random() < 0.5).encode('utf-8')
+
+
+def random_chunks(rnd, body):
+    """Split a body at random byte offsets, including ones inside multi-byte characters"""
+    cuts = sorted(rnd.sample(range(1, len(body)), min(len(body) - 1, rnd.randint(0, 60))))
+    return [body[start:end] for start, end in zip([0] + cuts, cuts + [len(body)])]
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_random_chunking_matches_json_loads(seed):
+    """Any chunking of a response yields the issues and metadata json.loads reads from it"""
+    rnd = random.Random(seed)
+    body = random_response(rnd)
+    expected = json.loads(body)
+
+    issues = []
+    metadata = parse_search_response(random_chunks(rnd, body), issues.append)
+
+    assert issues == expected.pop('issues')
+    assert metadata == expected
+
+
+def test_byte_at_a_time():
+    """Feeding one byte per chunk still parses the whole response"""
+    body = random_response(random.Random(0))
+    issues = []
+    metadata = parse_search_response((body[index:index + 1] for index in range(len(body))), issues.append)
+
+    expected = json.loads(body)
+    assert issues == expected.pop('issues')
+    assert metadata == expected
+
+
+def test_truncated_response_raises():
+    """A body cut short is an error instead of a silently partial page"""
+    body = random_response(random.Random(1))
+    with pytest.raises(ValueError):
+        parse_search_response([body[:len(body) // 2]], lambda issue: None)
+
+
+def test_non_object_response_raises():
+    """Only a JSON object is a search response"""
+    parser = SearchResponseParser(lambda issue: None)
+    with pytest.raises(ValueError):
+        parser.feed(b'[1, 2, 3]')
+
+
+class DroppingResponse:
+    """Streamed response whose connection drops after `cut` bytes of the body"""
+
+    def __init__(self, body, cut=None):
+        self.body = body
+        self.cut = cut
+        self.status_code = 200
+        self.headers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        end = len(self.body) if self.cut is None else self.cut
+        for start in range(0, end, chunk_size):
+            yield self.body[start:min(start + chunk_size, end)]
+        if self.cut is not None:
+            raise requests.exceptions.ChunkedEncodingError('Connection broken: IncompleteRead')
+
+
+def stream_with_drops(monkeypatch, responses, issues):
+    """Stream a search page into `issues` through JiraTransport.get while the session hands out `responses` in turn"""
+    client = transport.JiraTransport('user@example.com', 'token')
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(client.session, 'get', get)
+    monkeypatch.setattr(transport.time, 'sleep', lambda seconds: None)
+    return client.get('search', {'jql': 'project = AICP'}, issues.append), calls
+
+
+def test_body_dropped_mid_page_is_retried_without_duplicates(monkeypatch):
+    """A connection dropped while reading a page retries it and only the complete page reaches `on_issue`"""
+    body = random_response(random.Random(2))
+    expected = json.loads(body)
+
+    issues = []
+    metadata, calls = stream_with_drops(
+        monkeypatch, [DroppingResponse(body, len(body) // 2), DroppingResponse(body)], issues
+    )
+
+    assert len(calls) == 2
+    assert issues == expected.pop('issues')
+    assert metadata == expected
+
+
+def test_body_dropped_on_every_attempt_raises_without_issues(monkeypatch):
+    """Once retries run out the error propagates and no partial page was handed out"""
+    body = random_response(random.Random(3))
+    issues = []
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        stream_with_drops(
+            monkeypatch, [DroppingResponse(body, len(body) // 2)] * (transport.HTTP_MAX_RETRIES + 1), issues
+        )
+    assert issues == []
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-q']))